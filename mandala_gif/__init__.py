@@ -0,0 +1,41 @@
+"""Mandala-GIF creates a GIF of a mandala-like design using Pillow.
+
+Importing the package is quick: Pillow is only loaded once one of the classes below is used,
+NumPy only once a frame is drawn, and imageio only once a GIF is written.
+
+    from mandala_gif import Renderer
+
+    renderer = Renderer({'circle_line_distance': 6})
+    image = renderer.render_frame(5)
+    gif_bytes = renderer.render_animation()
+"""
+
+# The module each public name lives in, imported the first time the name is used.
+_exports = {'Checkpoint': 'files',
+            'CostModel': 'estimate',
+            'DeleteImages': 'files',
+            'EquivalenceHarness': 'equivalence',
+            'GifCreator': 'files',
+            'LayerPool': 'parallel',
+            'Mandala': 'mandala',
+            'RenderEstimator': 'estimate',
+            'RenderService': 'service',
+            'Renderer': 'renderer',
+            'Sweep': 'sweep'}
+
+__all__ = sorted(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f'.{_exports[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
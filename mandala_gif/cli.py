@@ -0,0 +1,303 @@
+# cli.py - The command line interface for Mandala-GIF.
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from .encoders import encoders
+from .equivalence import EquivalenceHarness, backends
+from .estimate import CostModel, RenderEstimator
+from .files import Checkpoint, DeleteImages, GifCreator
+from .mandala import Mandala
+from .parallel import LayerPool
+from .renderer import Renderer
+from .scheduler import MemoryScheduler, create_frames, parse_memory, render_worker_frame
+from .service import RenderService
+from .sweep import Sweep, get_grid_variants
+
+
+def parse_setting(text):
+    """Turns a NAME=VALUE command line argument into a setting name and number."""
+
+    name, separator, value = text.partition('=')
+    if not separator:
+        raise argparse.ArgumentTypeError(f"Expected NAME=VALUE, not {text!r}")
+    try:
+        return name, int(value)
+    except ValueError:
+        try:
+            return name, float(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Setting {name} must be a number, not {value!r}")
+
+
+def parse_sweep(text):
+    """Turns a NAME=VALUE,VALUE,... command line argument into a setting name and list of numbers."""
+
+    name, separator, values = text.partition('=')
+    if not separator or not values:
+        raise argparse.ArgumentTypeError(f"Expected NAME=VALUE,VALUE,..., not {text!r}")
+    return name, [parse_setting(f'{name}={value}')[1] for value in values.split(',')]
+
+
+def parse_frame_range(text):
+    """Turns a FIRST-LAST command line argument into a pair of frame numbers."""
+
+    first_frame, separator, last_frame = text.partition('-')
+    try:
+        return int(first_frame), int(last_frame if separator else first_frame)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected a frame range like 1-30, not {text!r}")
+
+
+def parse_region(text):
+    """Turns a LEFT,TOP,RIGHT,BOTTOM command line argument into a box."""
+
+    try:
+        left, top, right, bottom = (int(side) for side in text.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected a region like 600,600,1000,1000, not {text!r}")
+    return left, top, right, bottom
+
+
+def render_frames(draw, scheduler, checkpoint=None, parser=None):
+    """Draws the frames in this process, or on the scheduler's workers when there is a memory budget."""
+
+    if scheduler is None:
+        draw.create_frames(checkpoint)
+        return
+    try:
+        create_frames(draw, scheduler, checkpoint)
+    except ValueError as error:
+        parser.error(str(error))
+
+
+def stream_frames(settings, preset, scheduler, target, encoder_options, parser):
+    """Draws the frames and hands each one straight to a stream encoder, with no PNG files in between.
+
+    Progress is printed to standard error, since standard output may be carrying the frames.
+    """
+
+    renderer = Renderer(settings, preset=preset)
+    if scheduler is None:
+        images = renderer.render_frames()
+    else:
+        images = scheduler.map(render_worker_frame, [(settings, preset, frame)
+                                                     for frame in range(1, renderer.frame_count + 1)])
+
+    def report_frames():
+        for frame, image in enumerate(images, 1):
+            print(f"Creating frame {frame} of {renderer.frame_count}...", file=sys.stderr)
+            yield image
+
+    gif = GifCreator(create_gif=False, frame_count=renderer.frame_count, **encoder_options)
+    try:
+        gif.write_gif(sys.stdout.buffer if target == '-' else target, report_frames())
+    except ValueError as error:
+        parser.error(str(error))
+    if scheduler is not None:
+        print(scheduler.format_report(), file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create a GIF of a mandala-like design.")
+    parser.add_argument('--set', dest='settings', metavar='NAME=VALUE', type=parse_setting,
+                        action='append', default=[], help="override one of the image settings")
+    parser.add_argument('-o', '--output',
+                        help="path to write the animation to, the PNG when drawing a region, or the folder "
+                             "for a sweep (Mandala-GIF.gif, Mandala-region.png or Mandala-sweep by default). "
+                             "Raw, y4m and npy frames can go to a named pipe, or to standard output with -")
+    parser.add_argument('--preset', choices=sorted(Mandala.presets), default='standard',
+                        help="draft renders quickly at half size, final smooths the edges (default: standard)")
+    parser.add_argument('--format', choices=sorted(encoders), default='gif',
+                        help="the animation format to write, or raw, y4m or npy to stream uncompressed frames "
+                             "as they are drawn (default: gif)")
+    parser.add_argument('--lossless', action='store_true', help="compress WebP frames without losing detail")
+    parser.add_argument('--quality', type=int,
+                        help="WebP quality from 0 to 100, or the effort spent on lossless frames")
+    parser.add_argument('--jobs', type=int,
+                        help="how many frames to compress, or sweep frames to render, at once (default: one per CPU)")
+    parser.add_argument('--max-memory', metavar='SIZE', type=parse_memory,
+                        help="render frames on worker processes, as many as fit in this much memory, e.g. 4G")
+    parser.add_argument('--sweep', metavar='NAME=VALUE,VALUE,...', type=parse_sweep, action='append', default=[],
+                        help="render a variant for every combination of these setting values")
+    parser.add_argument('--variants', metavar='FILE',
+                        help="render a variant for each object of settings in this JSON list")
+    parser.add_argument('--no-disk', action='store_true',
+                        help="keep the frames in memory instead of saving them to a temporary folder")
+    parser.add_argument('--workdir',
+                        help="save the frames and a checkpoint in this folder instead of a temporary one")
+    parser.add_argument('--resume', action='store_true',
+                        help="carry on with an interrupted render from its last finished frame")
+    parser.add_argument('--estimate', action='store_true',
+                        help="print the predicted time, peak memory and output size as JSON without rendering")
+    parser.add_argument('--calibrate', action='store_true',
+                        help="measure the costs on this computer before estimating")
+    parser.add_argument('--frames', metavar='FIRST-LAST', type=parse_frame_range,
+                        help="the frames to estimate or check, all of them by default when estimating "
+                             "and frame 1 when checking")
+    parser.add_argument('--check-backends', metavar='BACKEND', nargs='*', choices=sorted(backends),
+                        help="compare these ways of drawing against golden frames from the reference, "
+                             "all of them if none are named")
+    parser.add_argument('--golden', default='golden-frames',
+                        help="folder holding the golden frames (default: golden-frames)")
+    parser.add_argument('--update-golden', action='store_true',
+                        help="draw the golden frames again with the reference")
+    parser.add_argument('--tolerance', dest='tolerances', metavar='NAME=VALUE', type=parse_setting,
+                        action='append', default=[],
+                        help="allow a backend this much difference, e.g. max_error=2 or min_ssim=0.99")
+    parser.add_argument('--region', metavar='LEFT,TOP,RIGHT,BOTTOM', type=parse_region,
+                        help="only draw this box of one frame, saved as a PNG")
+    parser.add_argument('--frame', type=int, default=1, help="the frame to draw the region of")
+    parser.add_argument('--scale', type=float, default=1, help="how much to scale the region by")
+    parser.add_argument('--layer-jobs', type=int,
+                        help="draw the layers of a region, or of each service job, on this many processes")
+    parser.add_argument('--serve', action='store_true',
+                        help="keep running and render jobs sent to a local HTTP API")
+    parser.add_argument('--host', default='127.0.0.1', help="address for the render service")
+    parser.add_argument('--port', type=int, default=8765, help="port for the render service")
+    args = parser.parse_args()
+    settings = dict(args.settings)
+    try:
+        Mandala(settings, preset=args.preset, canvas=False)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.estimate:
+        if args.preset != 'standard':
+            parser.error("--estimate can only predict standard renders")
+        cost_model = CostModel()
+        if args.calibrate:
+            cost_model.calibrate()
+        first_frame, last_frame = args.frames or (1, None)
+        try:
+            estimator = RenderEstimator(settings, first_frame, last_frame, cost_model, args.no_disk)
+        except ValueError as error:
+            parser.error(str(error))
+        print(json.dumps(estimator.get_estimate(), indent=2))
+        return
+
+    if args.check_backends is not None:
+        if args.preset != 'standard':
+            parser.error("--check-backends always compares standard renders")
+        first_frame, last_frame = args.frames or (1, 1)
+        try:
+            harness = EquivalenceHarness(settings, range(first_frame, last_frame + 1), args.golden,
+                                         dict(args.tolerances))
+            results = harness.run(args.check_backends, args.update_golden)
+        except ValueError as error:
+            parser.error(str(error))
+        print(harness.format_report(results))
+        if not all(result['passed'] for result in results):
+            raise SystemExit(1)
+        return
+
+    if args.layer_jobs is not None and not (args.serve or args.region):
+        parser.error("--layer-jobs only speeds up --region and --serve")
+    layer_pool = LayerPool(args.layer_jobs) if args.layer_jobs is not None else None
+
+    if args.serve:
+        if args.preset != 'standard':
+            parser.error("--preset is chosen for each job sent to the render service")
+        RenderService(args.host, args.port, layer_pool).serve()
+        return
+
+    if args.region:
+        try:
+            renderer = Renderer(settings, preset=args.preset, layer_pool=layer_pool)
+            image = renderer.render_region(args.frame, args.region, args.scale)
+        except ValueError as error:
+            parser.error(str(error))
+        finally:
+            if layer_pool is not None:
+                layer_pool.shutdown()
+        image.save(args.output or 'Mandala-region.png')
+        return
+
+    encoder_options = {'encoder': args.format, 'workers': args.jobs}
+    if args.format == 'webp':
+        encoder_options['lossless'] = args.lossless
+        if args.quality is not None:
+            encoder_options['quality'] = args.quality
+    elif args.lossless or args.quality is not None:
+        parser.error("--lossless and --quality can only be used with --format webp")
+
+    if args.sweep or args.variants:
+        if args.sweep and args.variants:
+            parser.error("--sweep and --variants cannot be used together")
+        if args.sweep:
+            variants = get_grid_variants(dict(args.sweep), settings)
+        else:
+            try:
+                variants = [dict(settings, **variant) for variant in json.loads(Path(args.variants).read_text())]
+            except (OSError, ValueError, TypeError) as error:
+                parser.error(f"Could not read the variants in {args.variants}: {error}")
+        try:
+            sweep = Sweep(variants, args.output or 'Mandala-sweep', args.preset, max_memory=args.max_memory,
+                          **encoder_options)
+            index_path = sweep.run()
+        except ValueError as error:
+            parser.error(str(error))
+        print(f"Sweep written, see {index_path}")
+        return
+
+    if args.output is None:
+        args.output = 'Mandala-GIF' + encoders[args.format].extension
+
+    scheduler = None
+    if args.max_memory is not None:
+        # The predicted memory of a worker lets a budget that is too small be refused before any worker starts.
+        worker_memory = CostModel().get_worker_memory(Mandala(settings, preset=args.preset, canvas=False))
+        try:
+            scheduler = MemoryScheduler(args.max_memory, args.jobs, worker_memory)
+            scheduler.get_worker_limit()
+        except ValueError as error:
+            parser.error(str(error))
+
+    if encoders[args.format].streams:
+        if args.workdir or args.resume:
+            parser.error(f"--workdir and --resume cannot be used with --format {args.format}, "
+                         f"which never saves frames to disk")
+        stream_frames(settings, args.preset, scheduler, args.output, encoder_options, parser)
+        return
+
+    if args.workdir:
+        if args.no_disk:
+            parser.error("--no-disk cannot be used with --workdir")
+        Path(args.workdir).mkdir(parents=True, exist_ok=True)
+
+        draw = Mandala(settings, output_dir=args.workdir, preset=args.preset)
+        checkpoint = Checkpoint(args.workdir, dict(draw.settings, preset=draw.preset))
+        try:
+            first_frame = checkpoint.load(args.resume)
+        except ValueError as error:
+            parser.error(str(error))
+
+        if first_frame > 1:
+            print(f"Resuming from frame {first_frame} of {draw.frame_count}...")
+        if first_frame <= draw.frame_count:
+            draw.seek_frame(first_frame)
+            render_frames(draw, scheduler, checkpoint, parser)
+
+        gif = GifCreator(args.output, args.workdir, **encoder_options)
+        images = DeleteImages(args.workdir)
+        checkpoint.delete()
+        return
+    elif args.resume:
+        parser.error("--resume needs the --workdir of the render to carry on with")
+
+    if args.no_disk:
+        draw = Mandala(settings, preset=args.preset)
+        render_frames(draw, scheduler, parser=parser)
+        gif = GifCreator(args.output, create_gif=False, **encoder_options)
+        gif.create_gif(draw.frames)
+        return
+
+    # Each run gets its own workspace, so several runs can share a folder.
+    with tempfile.TemporaryDirectory(prefix='Mandala-GIF-') as workspace:
+        draw = Mandala(settings, output_dir=workspace, preset=args.preset)
+        render_frames(draw, scheduler, parser=parser)
+        gif = GifCreator(args.output, workspace, **encoder_options)
+        images = DeleteImages(workspace)
@@ -0,0 +1,151 @@
+# draw.py - Stand-ins for ImageDraw that count or crop the primitives the mandala draws.
+
+from PIL import ImageDraw
+
+
+def get_bounds(xy):
+    """Returns the bounding box of coordinates given to an ImageDraw method."""
+
+    if isinstance(xy[0], (int, float)):
+        x_values = xy[0::2]
+        y_values = xy[1::2]
+    else:
+        x_values = [point[0] for point in xy]
+        y_values = [point[1] for point in xy]
+
+    return min(x_values), min(y_values), max(x_values), max(y_values)
+
+
+class PrimitiveCounter:
+    """A class that stands in for ImageDraw, counting the primitives each layer draws instead of drawing them."""
+
+    def __init__(self, image_side):
+        """A method to prepare the primitive counts."""
+
+        self.image_side = image_side
+        self.layer = None
+
+        # The number of calls and pixels touched, keyed by layer, shape and style.
+        self.counts = {}
+
+    def arc(self, xy, start, end, fill=None, width=1):
+        self.count_primitive('arc', xy, 'outline', width, (end - start) % 360 or 360)
+
+    def chord(self, xy, start, end, fill=None, outline=None, width=1):
+        self.count_primitive('chord', xy, 'fill' if fill is not None else 'outline', width)
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        self.count_primitive('ellipse', xy, 'fill' if fill is not None else 'outline', width)
+
+    def line(self, xy, fill=None, width=0):
+        self.count_primitive('line', xy, 'outline', width)
+
+    def pieslice(self, xy, start, end, fill=None, outline=None, width=1):
+        self.count_primitive('pieslice', xy, 'fill' if fill is not None else 'outline', width)
+
+    def polygon(self, xy, fill=None, outline=None, width=1):
+        self.count_primitive('polygon', xy, 'fill' if fill is not None else 'outline', width)
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self.count_primitive('rectangle', xy, 'fill' if fill is not None else 'outline', width)
+
+    def square_gradient(self, xy):
+        """A method to count the background gradient, which is built with NumPy rather than drawn, by its pixels."""
+
+        self.count_primitive('gradient', xy, 'fill', 1)
+
+    def count_primitive(self, shape, xy, style, width, sweep=360):
+        """A method to add a primitive, and roughly how many pixels it touches, to the counts."""
+
+        x0, y0, x1, y1 = get_bounds(xy)
+        box_width = max(0, min(x1, self.image_side) - max(x0, 0))
+        box_height = max(0, min(y1, self.image_side) - max(y0, 0))
+
+        if style == 'fill':
+            pixels = box_width * box_height
+        else:
+            pixels = 2 * (box_width + box_height) * max(width, 1) * sweep / 360
+
+        counts = self.counts.setdefault((self.layer, shape, style), [0, 0])
+        counts[0] += 1
+        counts[1] += pixels
+
+
+class RegionDraw:
+    """A class that stands in for ImageDraw, drawing only the primitives that reach a region, scaled to fit its image."""
+
+    def __init__(self, image, box, scale):
+        """A method to prepare drawing the box of the full image onto a smaller image."""
+
+        self.draw = ImageDraw.Draw(image)
+        self.box = box
+        self.scale = scale
+
+    def arc(self, xy, start, end, fill=None, width=1):
+        if self.reaches_region(xy, width):
+            self.draw.arc(self.scale_box(xy), start, end, fill=fill, width=self.scale_width(width))
+
+    def chord(self, xy, start, end, fill=None, outline=None, width=1):
+        if self.reaches_region(xy, width):
+            self.draw.chord(self.scale_box(xy), start, end, fill=fill, outline=outline,
+                            width=self.scale_width(width))
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        if self.reaches_region(xy, width):
+            self.draw.ellipse(self.scale_box(xy), fill=fill, outline=outline, width=self.scale_width(width))
+
+    def line(self, xy, fill=None, width=0):
+        if self.reaches_region(xy, width):
+            self.draw.line(self.scale_points(xy), fill=fill, width=self.scale_width(width))
+
+    def pieslice(self, xy, start, end, fill=None, outline=None, width=1):
+        if self.reaches_region(xy, width):
+            self.draw.pieslice(self.scale_box(xy), start, end, fill=fill, outline=outline,
+                               width=self.scale_width(width))
+
+    def polygon(self, xy, fill=None, outline=None, width=1):
+        if self.reaches_region(xy, width):
+            self.draw.polygon(self.scale_points(xy), fill=fill, outline=outline, width=self.scale_width(width))
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        if self.reaches_region(xy, width):
+            self.draw.rectangle(self.scale_box(xy), fill=fill, outline=outline, width=self.scale_width(width))
+
+    def reaches_region(self, xy, width):
+        """A method to check whether a primitive's bounding box, grown by its line width, touches the region."""
+
+        x0, y0, x1, y1 = get_bounds(xy)
+        width = max(width, 1)
+        return (x0 - width < self.box[2] and x1 + width >= self.box[0]
+                and y0 - width < self.box[3] and y1 + width >= self.box[1])
+
+    def scale_box(self, xy):
+        """A method to move and scale a bounding box, so each pixel of it covers the pixels it scales up to."""
+
+        x0, y0, x1, y1 = get_bounds(xy)
+        x0, y0 = self.move_point(x0 * self.scale, y0 * self.scale)
+        x1, y1 = self.move_point((x1 + 1) * self.scale - 1, (y1 + 1) * self.scale - 1)
+        return x0, y0, max(x0, x1), max(y0, y1)
+
+    def scale_points(self, xy):
+        """A method to move and scale a list of points onto the middle of the pixels they scale up to."""
+
+        if isinstance(xy[0], (int, float)):
+            xy = list(zip(xy[0::2], xy[1::2]))
+        offset = (self.scale - 1) / 2
+        return [self.move_point(x * self.scale + offset, y * self.scale + offset) for x, y in xy]
+
+    def move_point(self, x, y):
+        """A method to move a scaled point onto the region's image.
+
+        ImageDraw truncates coordinates towards zero, so they are truncated where they are in the scaled full image,
+        as they would be if it were drawn whole, and only then moved. Points that end up left of or above the
+        region would otherwise be truncated the other way.
+        """
+
+        return int(x) - self.box[0] * self.scale, int(y) - self.box[1] * self.scale
+
+    def scale_width(self, width):
+        """A method to scale a line width, keeping it at least one pixel wide."""
+
+        return max(1, round(max(width, 1) * self.scale))
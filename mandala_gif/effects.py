@@ -0,0 +1,92 @@
+# effects.py - Reapplies image filters only where a frame has changed since the last one.
+
+from PIL import ImageChops
+
+
+def get_blur_support(radius):
+    """Returns how far, in pixels, a change can spread through Pillow's Gaussian blur of the given radius.
+
+    Pillow blurs with three passes of a box blur, each no wider than the radius plus one pixel on either side.
+    """
+
+    return 3 * (int(radius) + 1)
+
+
+def get_box_area(boxes):
+    """Returns the total area of a list of boxes, counting any overlaps twice."""
+
+    return sum(max(0, right - left) * max(0, bottom - top) for left, top, right, bottom in boxes)
+
+
+def grow_box(box, amount, size):
+    """Returns a box grown by an amount on every side, kept inside an image of the given size."""
+
+    left, top, right, bottom = box
+    return max(0, left - amount), max(0, top - amount), min(size[0], right + amount), min(size[1], bottom + amount)
+
+
+def get_changed_boxes(previous, current, tile_size, support):
+    """Returns boxes covering every pixel whose filtered value can differ between two images.
+
+    The images are compared a tile at a time, each changed tile is grown by the blur support,
+    and runs of tiles are joined into as few boxes as possible.
+    """
+
+    import numpy as np
+
+    width, height = current.size
+    difference = ImageChops.difference(previous, current)
+    if difference.getbbox() is None:
+        return []
+    # The largest difference in any band, worked out by Pillow since it is much quicker than NumPy on RGB images.
+    red, green, blue = difference.split()
+    changed_pixels = np.asarray(ImageChops.lighter(ImageChops.lighter(red, green), blue))
+    columns, rows = -(-width // tile_size), -(-height // tile_size)
+    padded_pixels = np.zeros((rows * tile_size, columns * tile_size), dtype=np.uint8)
+    padded_pixels[:height, :width] = changed_pixels
+    changed_tiles = padded_pixels.reshape(rows, tile_size, columns, tile_size).max(axis=(1, 3)) > 0
+
+    # Grow the changed tiles by enough whole tiles to cover the blur support.
+    reach = -(-support // tile_size)
+    grown_tiles = np.zeros((rows + 2 * reach, columns + 2 * reach), dtype=bool)
+    for row_offset in range(2 * reach + 1):
+        for column_offset in range(2 * reach + 1):
+            grown_tiles[row_offset:row_offset + rows, column_offset:column_offset + columns] |= changed_tiles
+    grown_tiles = grown_tiles[reach:reach + rows, reach:reach + columns]
+
+    # Join the tiles in each row into runs, and runs with the same columns in following rows into boxes.
+    boxes = []
+    open_runs = {}
+    for row in range(rows + 1):
+        runs = []
+        if row < rows:
+            run_start = None
+            for column in range(columns + 1):
+                if column < columns and grown_tiles[row, column]:
+                    if run_start is None:
+                        run_start = column
+                elif run_start is not None:
+                    runs.append((run_start, column))
+                    run_start = None
+
+        still_open = {}
+        for run in runs:
+            still_open[run] = open_runs.pop(run, row)
+        for (first_column, last_column), first_row in open_runs.items():
+            boxes.append((first_column * tile_size, first_row * tile_size,
+                          min(width, last_column * tile_size), min(height, row * tile_size)))
+        open_runs = still_open
+
+    return boxes
+
+
+def apply_filter_to_boxes(image, previous_output, boxes, image_filter, support):
+    """Returns the previous filtered image with only the boxes filtered again from the new image."""
+
+    output = previous_output.copy()
+    for box in boxes:
+        padded_box = grow_box(box, support, image.size)
+        filtered = image.crop(padded_box).filter(image_filter)
+        output.paste(filtered.crop((box[0] - padded_box[0], box[1] - padded_box[1],
+                                    box[2] - padded_box[0], box[3] - padded_box[1])), box[:2])
+    return output
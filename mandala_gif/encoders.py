@@ -0,0 +1,366 @@
+# encoders.py - Encoders that join the frames into an animated GIF, WebP or PNG file, or stream them uncompressed.
+
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from fractions import Fraction
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+
+
+def encode_webp_frame(image, lossless, quality, method):
+    """Compresses one frame as a still WebP image."""
+
+    buffer = BytesIO()
+    image.save(buffer, format='WEBP', lossless=lossless, quality=quality, method=method)
+    return buffer.getvalue()
+
+
+def encode_png_frame(image, compress_level):
+    """Compresses one frame as a still PNG image."""
+
+    buffer = BytesIO()
+    image.save(buffer, format='PNG', compress_level=compress_level)
+    return buffer.getvalue()
+
+
+def read_chunks(data, offset, little_endian):
+    """Yields the type and contents of each chunk in a RIFF (WebP) or PNG file, starting at the offset."""
+
+    while offset < len(data):
+        if little_endian:
+            chunk_type = data[offset:offset + 4]
+            size, = struct.unpack('<I', data[offset + 4:offset + 8])
+            yield chunk_type, data[offset + 8:offset + 8 + size]
+            offset += 8 + size + size % 2
+        else:
+            size, = struct.unpack('>I', data[offset:offset + 4])
+            chunk_type = data[offset + 4:offset + 8]
+            yield chunk_type, data[offset + 8:offset + 8 + size]
+            offset += 12 + size
+
+
+class FrameEncoder:
+    """A base class for encoders that compress the frames in parallel, then join them in order."""
+
+    extension = None
+
+    # Whether frames are compressed in worker processes rather than threads, for encoders that hold the GIL.
+    use_processes = False
+
+    # Whether each frame is written as soon as it is drawn, so the frames can be rendered straight into the encoder.
+    streams = False
+
+    def __init__(self, frame_duration=0.08, workers=None):
+        """A method to control settings shared by every encoder."""
+
+        self.frame_duration = frame_duration
+        self.workers = workers
+
+    def write(self, target, images):
+        """A method to write the animation to a file name or file object."""
+
+        data = self.encode(images)
+        if hasattr(target, 'write'):
+            target.write(data)
+        else:
+            Path(target).write_bytes(data)
+
+    def encode(self, images):
+        """Returns the animation as bytes."""
+
+        return self.join_frames(list(self.compress_frames(images)))
+
+    def compress_frames(self, images):
+        """A method to compress the frames on a pool of workers, yielding them in order."""
+
+        workers = self.workers or os.cpu_count() or 1
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        with executor_class(workers) as executor:
+            # Only hand out a few frames per worker at a time, so the frames are not all held in memory at once.
+            pending_frames = []
+            for image in images:
+                pending_frames.append(executor.submit(self.compress_frame, image))
+                if len(pending_frames) > workers * 2:
+                    yield pending_frames.pop(0).result()
+            for pending_frame in pending_frames:
+                yield pending_frame.result()
+
+    def compress_frame(self, image):
+        raise NotImplementedError
+
+    def join_frames(self, frames):
+        raise NotImplementedError
+
+
+class GifEncoder(FrameEncoder):
+    """A class to write the frames as a GIF with imageio, as GifCreator always has."""
+
+    extension = '.gif'
+
+    def write(self, target, images):
+        """A method to write images to a GIF file name or file object."""
+
+        # imageio is only imported when it is needed, since it takes a while to load.
+        import imageio.v2 as io
+
+        with io.get_writer(target, format='GIF', mode='I', duration=self.frame_duration) as writer:
+            for image in images:
+                writer.append_data(image)
+
+    def encode(self, images):
+        """Returns the GIF as bytes."""
+
+        buffer = BytesIO()
+        self.write(buffer, images)
+        return buffer.getvalue()
+
+
+class WebPEncoder(FrameEncoder):
+    """A class to write the frames as an animated WebP, lossless or lossy."""
+
+    extension = '.webp'
+
+    def __init__(self, frame_duration=0.08, workers=None, lossless=False, quality=90, method=4):
+        """A method to control the WebP compression settings. For lossless frames, quality is the effort spent."""
+
+        super().__init__(frame_duration, workers)
+        self.compress_frame = partial(encode_webp_frame, lossless=lossless, quality=quality, method=method)
+
+    def join_frames(self, frames):
+        """A method to join still WebP frames into one animated WebP file."""
+
+        width, height = None, None
+        has_alpha = False
+        chunks = []
+        for frame in frames:
+            frame_chunks = [(chunk_type, chunk) for chunk_type, chunk in read_chunks(frame, 12, True)
+                            if chunk_type in (b'ALPH', b'VP8 ', b'VP8L')]
+            frame_width, frame_height = self.get_frame_size(frame_chunks[-1])
+            if width is None:
+                width, height = frame_width, frame_height
+            elif (frame_width, frame_height) != (width, height):
+                raise ValueError("Every frame of an animated WebP must have the same size")
+            has_alpha = has_alpha or self.has_alpha(frame_chunks)
+
+            # Each frame covers the whole canvas, is shown for the frame duration and replaces the one before.
+            frame_header = (b'\x00' * 6 + (frame_width - 1).to_bytes(3, 'little')
+                            + (frame_height - 1).to_bytes(3, 'little')
+                            + round(self.frame_duration * 1000).to_bytes(3, 'little') + b'\x02')
+            chunks.append(self.make_chunk(b'ANMF', frame_header + b''.join(self.make_chunk(*chunk)
+                                                                            for chunk in frame_chunks)))
+
+        flags = 0x02 | (0x10 if has_alpha else 0)
+        header_chunks = (self.make_chunk(b'VP8X', bytes([flags]) + b'\x00' * 3 + (width - 1).to_bytes(3, 'little')
+                                         + (height - 1).to_bytes(3, 'little'))
+                         + self.make_chunk(b'ANIM', b'\x00' * 4 + struct.pack('<H', 0)))
+        body = b'WEBP' + header_chunks + b''.join(chunks)
+        return b'RIFF' + struct.pack('<I', len(body)) + body
+
+    def has_alpha(self, frame_chunks):
+        """A method to tell whether a frame has transparency.
+
+        Lossy frames keep it in an ALPH chunk, but lossless frames keep it in the VP8L chunk, marked by bit 28.
+        """
+
+        chunk_type, data = frame_chunks[-1]
+        if chunk_type == b'VP8L':
+            bits, = struct.unpack('<I', data[1:5])
+            return bool(bits & 0x10000000)
+        return frame_chunks[0][0] == b'ALPH'
+
+    def get_frame_size(self, chunk):
+        """A method to read the width and height from a VP8 or VP8L chunk."""
+
+        chunk_type, data = chunk
+        if chunk_type == b'VP8L':
+            bits, = struct.unpack('<I', data[1:5])
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        width, height = struct.unpack('<HH', data[6:10])
+        return width & 0x3FFF, height & 0x3FFF
+
+    def make_chunk(self, chunk_type, data):
+        """A method to build a RIFF chunk, padded to an even length."""
+
+        return chunk_type + struct.pack('<I', len(data)) + data + b'\x00' * (len(data) % 2)
+
+
+class APNGEncoder(FrameEncoder):
+    """A class to write the frames as an animated PNG."""
+
+    extension = '.png'
+
+    # Pillow holds the GIL while it compresses a PNG into memory, so the frames are compressed in processes.
+    use_processes = True
+
+    def __init__(self, frame_duration=0.08, workers=None, compress_level=6):
+        """A method to control the PNG compression level."""
+
+        super().__init__(frame_duration, workers)
+        self.compress_frame = partial(encode_png_frame, compress_level=compress_level)
+
+    def join_frames(self, frames):
+        """A method to join still PNG frames into one animated PNG file."""
+
+        header = None
+        chunks = []
+        sequence_number = 0
+        for frame_index, frame in enumerate(frames):
+            frame_chunks = list(read_chunks(frame, 8, False))
+            if header is None:
+                header = frame_chunks[0][1]
+                chunks.append(self.make_chunk(b'acTL', struct.pack('>II', len(frames), 0)))
+            elif frame_chunks[0][1] != header:
+                raise ValueError("Every frame of an animated PNG must have the same size and color type")
+
+            # Each frame covers the whole image, is shown for the frame duration and replaces the one before.
+            width, height = struct.unpack('>II', header[:8])
+            chunks.append(self.make_chunk(b'fcTL', struct.pack('>IIIIIHHBB', sequence_number, width, height, 0, 0,
+                                                                 round(self.frame_duration * 1000), 1000, 0, 0)))
+            sequence_number += 1
+
+            for chunk_type, data in frame_chunks:
+                if chunk_type != b'IDAT':
+                    continue
+                if frame_index == 0:
+                    # The first frame is also the still image shown by programs that cannot animate PNGs.
+                    chunks.append(self.make_chunk(b'IDAT', data))
+                else:
+                    chunks.append(self.make_chunk(b'fdAT', struct.pack('>I', sequence_number) + data))
+                    sequence_number += 1
+
+        return (b'\x89PNG\r\n\x1a\n' + self.make_chunk(b'IHDR', header) + b''.join(chunks)
+                + self.make_chunk(b'IEND', b''))
+
+    def make_chunk(self, chunk_type, data):
+        """A method to build a PNG chunk with its checksum."""
+
+        return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+
+class StreamEncoder(FrameEncoder):
+    """A base class for encoders that write each frame uncompressed as soon as it is drawn.
+
+    The target can be a file name, a named pipe or a file object such as standard output, and is flushed after
+    every frame so another program can read the frames while the rest are still being drawn.
+    """
+
+    streams = True
+
+    def __init__(self, frame_duration=0.08, workers=None, frame_count=None):
+        """A method to control settings shared by the stream encoders. frame_count is how many frames to expect."""
+
+        super().__init__(frame_duration, workers)
+        self.frame_count = frame_count
+
+    def write(self, target, images):
+        """A method to write each frame to a file name or file object as it arrives."""
+
+        if hasattr(target, 'write'):
+            self.write_frames(target, images)
+        else:
+            with open(target, 'wb') as file:
+                self.write_frames(file, images)
+
+    def write_frames(self, file, images):
+        """A method to write the header before the first frame, then each frame in turn."""
+
+        for frame_number, image in enumerate(images):
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            if frame_number == 0:
+                file.write(self.get_header(image.size))
+            file.write(self.get_frame(image))
+            file.flush()
+
+    def encode(self, images):
+        """Returns every frame, with the header, as bytes."""
+
+        buffer = BytesIO()
+        self.write(buffer, images)
+        return buffer.getvalue()
+
+    def get_header(self, size):
+        return b''
+
+    def get_frame(self, image):
+        raise NotImplementedError
+
+
+class RawEncoder(StreamEncoder):
+    """A class to stream the frames as raw rgb24 pixels, one after another, with no header."""
+
+    extension = '.rgb'
+
+    def get_frame(self, image):
+        """A method to return the frame's pixels, row by row, three bytes each."""
+
+        return image.tobytes()
+
+
+class Y4MEncoder(StreamEncoder):
+    """A class to stream the frames as YUV4MPEG2, which carries the frame size and rate in its header."""
+
+    extension = '.y4m'
+
+    def get_header(self, size):
+        """A method to describe full range 4:4:4 frames of the given size, at the rate set by the frame duration."""
+
+        frame_rate = Fraction(1 / self.frame_duration).limit_denominator(1001)
+        width, height = size
+        return (f'YUV4MPEG2 W{width} H{height} F{frame_rate.numerator}:{frame_rate.denominator} '
+                f'Ip A1:1 C444 XCOLORRANGE=FULL\n').encode('ascii')
+
+    def get_frame(self, image):
+        """A method to return the frame's Y, Cb and Cr planes, each a byte per pixel."""
+
+        # Pillow converts to YCbCr with the full range JPEG formula, which is what the header promises.
+        return b'FRAME\n' + b''.join(band.tobytes() for band in image.convert('YCbCr').split())
+
+
+class NpyEncoder(StreamEncoder):
+    """A class to write the frames into a NumPy .npy stack, shaped (frames, height, width, 3).
+
+    Written to a file name, the stack is memory-mapped, so each frame goes straight to the file and other programs
+    can map it too. The stack size is fixed in the header, so without a frame_count the frames are gathered first.
+    """
+
+    extension = '.npy'
+
+    def write(self, target, images):
+        """A method to write the frames to a memory-mapped file name, or to a file object in one go."""
+
+        import numpy as np
+
+        if not hasattr(target, 'write') and self.frame_count is not None:
+            stack = None
+            for frame_number, image in enumerate(images):
+                pixels = np.asarray(image.convert('RGB') if image.mode != 'RGB' else image)
+                if stack is None:
+                    stack = np.lib.format.open_memmap(target, mode='w+', dtype=np.uint8,
+                                                      shape=(self.frame_count,) + pixels.shape)
+                stack[frame_number] = pixels
+                stack.flush()
+            return
+
+        np.save(target, np.stack([np.asarray(image.convert('RGB') if image.mode != 'RGB' else image)
+                                  for image in images]))
+
+
+# The encoders that can be chosen by name.
+encoders = {'gif': GifEncoder,
+            'webp': WebPEncoder,
+            'apng': APNGEncoder,
+            'raw': RawEncoder,
+            'y4m': Y4MEncoder,
+            'npy': NpyEncoder}
+
+
+def get_encoder(name, **options):
+    """Returns the encoder with the given name, set up with the given options."""
+
+    if name not in encoders:
+        raise ValueError(f"Unknown format {name!r}, choose from {', '.join(encoders)}")
+    return encoders[name](**options)
@@ -0,0 +1,252 @@
+# equivalence.py - Checks that faster ways of drawing the mandala still draw the same picture.
+
+import json
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from .files import get_frame_path
+from .mandala import Mandala
+from .parallel import LayerPool
+from .renderer import Renderer
+
+
+def render_reference(settings, frames, gradient_arrays=False):
+    """Draws each frame with plain Pillow ImageDraw calls, on a new Mandala without any cached layers."""
+
+    images = []
+    for frame in frames:
+        mandala = Mandala(settings)
+        mandala.gradient_arrays = gradient_arrays
+        mandala.dirty_effects = False
+        mandala.seek_frame(frame)
+        mandala.draw_frame()
+        images.append(mandala.image_effects)
+    return images
+
+
+def render_gradient_arrays(settings, frames):
+    """Draws each frame like the reference, but builds the background gradient with NumPy."""
+
+    return render_reference(settings, frames, gradient_arrays=True)
+
+
+def render_cached_layers(settings, frames):
+    """Draws the frames with one Renderer, reusing the cached layers between frames."""
+
+    renderer = Renderer(settings)
+    return [renderer.render_frame(frame) for frame in frames]
+
+
+def render_dirty_effects(settings, frames):
+    """Draws the frames with one Renderer, applying the unsharp mask again only where each frame has changed.
+
+    Whole frames move too much to be under any area limit, so the limit is lifted to be sure the partial path is
+    the one being checked.
+    """
+
+    renderer = Renderer(settings)
+    images = []
+    for frame in frames:
+        mandala = renderer.get_mandala(frame)
+        mandala.dirty_area_limit = float('inf')
+        reuses_effects = mandala.previous_effects is not None
+        images.append(renderer.render_frame(frame))
+        if reuses_effects and mandala.effects_boxes is None:
+            raise RuntimeError(f"Frame {frame} was filtered whole instead of only where it changed")
+    return images
+
+
+def render_full_regions(settings, frames):
+    """Draws each frame as a region covering the whole image, through RegionDraw."""
+
+    renderer = Renderer(settings)
+    image_side = renderer.mandala.image_side
+    return [renderer.render_region(frame, (0, 0, image_side, image_side)) for frame in frames]
+
+
+def render_offset_regions(settings, frames):
+    """Draws each frame as four regions split off-centre, so none but the first starts at the origin,
+    and pastes them back together."""
+
+    renderers = [Renderer(settings) for corner in range(4)]
+    image_side = renderers[0].mandala.image_side
+    split_x, split_y = image_side * 7 // 16 + 1, image_side * 9 // 16 + 3
+    boxes = [(0, 0, split_x, split_y), (split_x, 0, image_side, split_y),
+             (0, split_y, split_x, image_side), (split_x, split_y, image_side, image_side)]
+
+    images = []
+    for frame in frames:
+        image = Image.new('RGB', (image_side, image_side))
+        for renderer, box in zip(renderers, boxes):
+            image.paste(renderer.render_region(frame, box), box[:2])
+        images.append(image)
+    return images
+
+
+def render_layer_pool(settings, frames):
+    """Draws the frames with groups of layers on two worker processes, and the unsharp mask in bands."""
+
+    layer_pool = LayerPool(2)
+    try:
+        renderer = Renderer(settings, layer_pool=layer_pool)
+        renderer.mandala.dirty_effects = False
+        return [renderer.render_frame(frame) for frame in frames]
+    finally:
+        layer_pool.shutdown()
+
+
+# The ways of drawing the frames that can be compared, by name. The reference is what the others are checked against.
+backends = {'reference': render_reference,
+            'gradient-arrays': render_gradient_arrays,
+            'cached-layers': render_cached_layers,
+            'dirty-effects': render_dirty_effects,
+            'full-region': render_full_regions,
+            'offset-regions': render_offset_regions,
+            'layer-pool': render_layer_pool}
+
+
+def get_luma(pixels):
+    """Returns the brightness of RGB pixels, as used by the structural similarity."""
+
+    return pixels[..., 0] * 0.299 + pixels[..., 1] * 0.587 + pixels[..., 2] * 0.114
+
+
+def get_window_means(values, window):
+    """Returns the mean of every window by window square of values, using a summed-area table."""
+
+    import numpy as np
+
+    sums = np.pad(values, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+    window_sums = sums[window:, window:] - sums[:-window, window:] - sums[window:, :-window] + sums[:-window, :-window]
+    return window_sums / window ** 2
+
+
+def compare_images(expected, actual, window=7):
+    """Returns per-pixel and perceptual differences between two images of the same size."""
+
+    if expected.size != actual.size:
+        raise ValueError(f"Cannot compare a {actual.size} image against a {expected.size} one")
+
+    import numpy as np
+
+    expected_pixels = np.asarray(expected.convert('RGB'), dtype=np.float64)
+    actual_pixels = np.asarray(actual.convert('RGB'), dtype=np.float64)
+    errors = np.abs(expected_pixels - actual_pixels)
+    squared_error = (errors ** 2).mean()
+
+    # The structural similarity of the brightness, averaged over every window of the image.
+    x, y = get_luma(expected_pixels), get_luma(actual_pixels)
+    mean_x, mean_y = get_window_means(x, window), get_window_means(y, window)
+    variance_x = get_window_means(x * x, window) - mean_x ** 2
+    variance_y = get_window_means(y * y, window) - mean_y ** 2
+    covariance = get_window_means(x * y, window) - mean_x * mean_y
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    ssim = ((2 * mean_x * mean_y + c1) * (2 * covariance + c2)
+            / ((mean_x ** 2 + mean_y ** 2 + c1) * (variance_x + variance_y + c2))).mean()
+
+    return {'max_error': float(errors.max()),
+            'mean_error': float(errors.mean()),
+            'changed_pixels': float((errors.max(axis=2) > 0).mean()),
+            'psnr': float('inf') if squared_error == 0 else float(10 * np.log10(255 ** 2 / squared_error)),
+            'ssim': float(ssim)}
+
+
+class EquivalenceHarness:
+    """A class to compare other ways of drawing the mandala against golden frames from the reference."""
+
+    # The largest errors allowed, and the smallest similarities, before a backend fails.
+    default_tolerances = {'max_error': 0, 'mean_error': 0, 'changed_pixels': 0, 'min_psnr': 0, 'min_ssim': 1}
+
+    def __init__(self, settings=None, frames=(1,), golden_dir='golden-frames', tolerances=None):
+        """A method to control which frames are compared, where the golden frames are kept and how close is enough."""
+
+        self.settings = dict(settings or {})
+        self.frames = list(frames)
+        self.golden_dir = Path(golden_dir)
+        self.tolerances = dict(self.default_tolerances)
+        for name, value in (tolerances or {}).items():
+            if name not in self.tolerances:
+                raise ValueError(f"Unknown tolerance: {name}")
+            self.tolerances[name] = value
+
+        # Checks the settings and frames before anything is drawn.
+        mandala = Mandala(self.settings)
+        for frame in self.frames:
+            if not 1 <= frame <= mandala.frame_count:
+                raise ValueError(f"Frame {frame} is outside frames 1-{mandala.frame_count}")
+        self.full_settings = mandala.settings
+
+    def load_golden_frames(self, update=False):
+        """A method to read the golden frames, drawing and storing them with the reference if needed."""
+
+        index_path = self.golden_dir / 'golden.json'
+        if index_path.exists() and not update:
+            index = json.loads(index_path.read_text())
+            if index['settings'] != self.full_settings:
+                raise ValueError(f"The golden frames in {self.golden_dir} were drawn with other settings, "
+                                 f"update them or choose another folder")
+            missing_frames = [frame for frame in self.frames if frame not in index['frames']]
+            if not missing_frames:
+                return {frame: Image.open(get_frame_path(self.golden_dir, frame)) for frame in self.frames}
+            frames = sorted(set(index['frames']) | set(missing_frames))
+        else:
+            frames = self.frames
+            missing_frames = self.frames
+
+        self.golden_dir.mkdir(parents=True, exist_ok=True)
+        for frame, image in zip(missing_frames, render_reference(self.settings, missing_frames)):
+            image.save(get_frame_path(self.golden_dir, frame))
+        index_path.write_text(json.dumps({'settings': self.full_settings, 'frames': frames}, indent=2))
+
+        return {frame: Image.open(get_frame_path(self.golden_dir, frame)) for frame in self.frames}
+
+    def run(self, backend_names=None, update=False):
+        """A method to time each backend and compare its frames against the golden frames."""
+
+        golden_frames = self.load_golden_frames(update)
+        backend_names = ['reference'] + [name for name in (backend_names or backends) if name != 'reference']
+
+        results = []
+        reference_seconds = None
+        for name in backend_names:
+            if name not in backends:
+                raise ValueError(f"Unknown backend {name!r}, choose from {', '.join(backends)}")
+
+            start_time = time.perf_counter()
+            images = backends[name](self.settings, self.frames)
+            seconds = time.perf_counter() - start_time
+            if reference_seconds is None:
+                reference_seconds = seconds
+
+            # Keep the worst value of each measure across the frames.
+            differences = [compare_images(golden_frames[frame], image) for frame, image in zip(self.frames, images)]
+            result = {'backend': name,
+                      'seconds': seconds,
+                      'speedup': reference_seconds / seconds,
+                      'max_error': max(difference['max_error'] for difference in differences),
+                      'mean_error': max(difference['mean_error'] for difference in differences),
+                      'changed_pixels': max(difference['changed_pixels'] for difference in differences),
+                      'psnr': min(difference['psnr'] for difference in differences),
+                      'ssim': min(difference['ssim'] for difference in differences)}
+            result['passed'] = (result['max_error'] <= self.tolerances['max_error']
+                                and result['mean_error'] <= self.tolerances['mean_error']
+                                and result['changed_pixels'] <= self.tolerances['changed_pixels']
+                                and result['psnr'] >= self.tolerances['min_psnr']
+                                and result['ssim'] >= self.tolerances['min_ssim'])
+            results.append(result)
+
+        return results
+
+    def format_report(self, results):
+        """A method to lay out the results as a table, one backend per row."""
+
+        lines = [f"Frames {', '.join(map(str, self.frames))} compared against {self.golden_dir}",
+                 f"{'backend':<16}{'seconds':>9}{'speedup':>9}{'max err':>9}{'mean err':>10}"
+                 f"{'changed':>9}{'PSNR':>8}{'SSIM':>8}  result"]
+        for result in results:
+            lines.append(f"{result['backend']:<16}{result['seconds']:>9.3f}{result['speedup']:>8.2f}x"
+                         f"{result['max_error']:>9.0f}{result['mean_error']:>10.4f}{result['changed_pixels']:>8.2%}"
+                         f"{result['psnr']:>8.1f}{result['ssim']:>8.4f}  {'ok' if result['passed'] else 'FAILED'}")
+        return '\n'.join(lines)
@@ -0,0 +1,213 @@
+# estimate.py - Predicts the time, memory and output size of a render without drawing it.
+
+import time
+from io import BytesIO
+from PIL import Image, ImageDraw
+
+from .draw import PrimitiveCounter
+from .files import GifCreator
+from .gradients import get_square_gradient_image
+from .mandala import Mandala
+
+
+class CostModel:
+    """A class holding how long each kind of rendering work takes, and how much memory and disk it uses."""
+
+    # The shapes and styles the mandala draws, with the boxes used to time them when calibrating.
+    calibration_shapes = {('arc', 'outline'): ('arc', {'start': 0, 'end': 90, 'fill': 1, 'width': 2}),
+                          ('chord', 'fill'): ('chord', {'start': 0, 'end': 180, 'fill': 1}),
+                          ('ellipse', 'fill'): ('ellipse', {'fill': 1}),
+                          ('ellipse', 'outline'): ('ellipse', {'outline': 1, 'width': 2}),
+                          ('line', 'outline'): ('line', {'fill': 1, 'width': 1}),
+                          ('pieslice', 'fill'): ('pieslice', {'start': 0, 'end': 4, 'fill': 1}),
+                          ('polygon', 'fill'): ('polygon', {'fill': 1, 'outline': 2}),
+                          ('polygon', 'outline'): ('polygon', {'outline': 1}),
+                          ('rectangle', 'fill'): ('rectangle', {'fill': 1}),
+                          ('rectangle', 'outline'): ('rectangle', {'outline': 1, 'width': 1})}
+
+    def __init__(self):
+        """A method to set the default costs, measured on a typical desktop computer."""
+
+        # Seconds per call and seconds per pixel touched, for each shape and style.
+        self.primitive_costs = {('arc', 'outline'): (4.8e-6, 9.5e-8),
+                                ('chord', 'fill'): (1.8e-6, 3.0e-10),
+                                ('ellipse', 'fill'): (2.2e-6, 5.4e-10),
+                                ('ellipse', 'outline'): (1.1e-6, 5.0e-9),
+                                ('line', 'outline'): (1.5e-6, 1.2e-9),
+                                ('pieslice', 'fill'): (3.6e-6, 1.2e-10),
+                                ('polygon', 'fill'): (2.9e-6, 6.7e-10),
+                                ('polygon', 'outline'): (2.8e-6, 2.0e-9),
+                                ('rectangle', 'fill'): (1.7e-6, 6.1e-10),
+                                ('rectangle', 'outline'): (1.1e-6, 1.7e-9)}
+
+        # Seconds per pixel of the background gradient, which is built with NumPy rather than drawn.
+        self.gradient_cost = 4.0e-9
+
+        # Seconds per pixel of each frame for the image effects, saving and reading back
+        # the PNG frame, and adding the frame to the GIF.
+        self.effects_cost = 4.7e-8
+        self.frame_file_cost = 1.5e-7
+        self.gif_cost = 1.2e-7
+
+        # Bytes per pixel of each frame on disk, and in memory while the GIF is written.
+        self.frame_file_size = 0.43
+        self.gif_size = 0.21
+        self.gif_memory = 6.6
+
+        # Bytes per pixel for each full-size image held while a frame is drawn: the image,
+        # the blurred copy made by the unsharp mask, the image effect copies, the cached background
+        # and the last frame's image kept for reusing its unsharp mask.
+        self.frame_memory = 4 * 6
+
+        # Memory used by Python and the imported modules before anything is drawn.
+        self.base_memory = 40 * 2 ** 20
+
+    def calibrate(self, image_side=1600, repeat=50):
+        """A method to measure the costs on this computer."""
+
+        try:
+            import resource
+        except ImportError:
+            # Windows has no resource module, so the built-in base memory is kept.
+            pass
+        else:
+            self.base_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        image = Image.new('RGB', (image_side, image_side))
+        draw = ImageDraw.Draw(image)
+        counter = PrimitiveCounter(image_side)
+        small_box = (10, 10, 20, 20)
+        large_box = (0, 0, image_side - 1, image_side - 1)
+
+        for key, (shape, arguments) in self.calibration_shapes.items():
+            timings = []
+            for box in (small_box, large_box):
+                xy = box if shape not in ('line', 'polygon') else [(box[0], box[1]), (box[2], box[1]),
+                                                                     (box[2], box[3]), (box[0], box[3])]
+                start_time = time.perf_counter()
+                for i in range(repeat):
+                    getattr(draw, shape)(xy, **arguments)
+                timings.append((time.perf_counter() - start_time) / repeat)
+                counter.counts.clear()
+                getattr(counter, shape)(xy, **arguments)
+                timings.append(counter.counts[(None,) + key][1])
+            small_time, small_pixels, large_time, large_pixels = timings
+            pixel_cost = max(0, (large_time - small_time) / (large_pixels - small_pixels))
+            self.primitive_costs[key] = (max(0, small_time - pixel_cost * small_pixels), pixel_cost)
+
+        # Time building the background gradient, which is not drawn with ImageDraw.
+        mandala = Mandala(canvas=False)
+        start_time = time.perf_counter()
+        get_square_gradient_image(mandala.background_colors, mandala.background_pattern_size,
+                                  mandala.background_hue_count, image_side)
+        self.gradient_cost = (time.perf_counter() - start_time) / image_side ** 2
+
+        # Time the effects, saving and GIF encoding on a real frame, since their cost depends on the picture.
+        # A single frame GIF carries its own palette, so the size measured here is a little high.
+        mandala = Mandala()
+        mandala.draw_frame()
+        pixel_count = mandala.image_side ** 2
+
+        start_time = time.perf_counter()
+        mandala.apply_image_effects()
+        self.effects_cost = (time.perf_counter() - start_time) / pixel_count
+
+        buffer = BytesIO()
+        start_time = time.perf_counter()
+        mandala.image_effects.save(buffer, format='PNG')
+        Image.open(BytesIO(buffer.getvalue())).load()
+        self.frame_file_cost = (time.perf_counter() - start_time) / pixel_count
+        self.frame_file_size = len(buffer.getvalue()) / pixel_count
+
+        buffer = BytesIO()
+        start_time = time.perf_counter()
+        GifCreator(create_gif=False).write_gif(buffer, [mandala.image_effects])
+        self.gif_cost = (time.perf_counter() - start_time) / pixel_count
+        self.gif_size = len(buffer.getvalue()) / pixel_count
+
+    def get_worker_memory(self, mandala):
+        """Returns the predicted peak memory of a process drawing the mandala's frames one at a time."""
+
+        image_side = mandala.image_side * mandala.render_scale * mandala.supersample
+        return int(self.base_memory + self.frame_memory * image_side ** 2)
+
+    def get_costs(self):
+        """A method to return the costs in a form that can be written as JSON."""
+
+        costs = {key: value for key, value in vars(self).items() if key != 'primitive_costs'}
+        costs['primitive_costs'] = {f'{shape} {style}': cost
+                                    for (shape, style), cost in self.primitive_costs.items()}
+        return costs
+
+
+class RenderEstimator:
+    """A class to predict the time, memory and output size of a render without drawing it."""
+
+    def __init__(self, settings=None, first_frame=1, last_frame=None, cost_model=None, in_memory=False):
+        """A method to count every primitive drawn in the frame range."""
+
+        self.mandala = Mandala(settings, canvas=False)
+        self.first_frame = first_frame
+        self.last_frame = self.mandala.frame_count if last_frame is None else last_frame
+        self.cost_model = CostModel() if cost_model is None else cost_model
+        self.in_memory = in_memory
+
+        if not 1 <= self.first_frame <= self.last_frame <= self.mandala.frame_count:
+            raise ValueError(f"Frame range {self.first_frame}-{self.last_frame} is outside "
+                             f"frames 1-{self.mandala.frame_count}")
+
+        self.counter = PrimitiveCounter(self.mandala.image_side)
+        self.count_primitives()
+
+    def count_primitives(self):
+        """A method to run each layer of each frame against the primitive counter."""
+
+        mandala = self.mandala
+        mandala.seek_frame(self.first_frame)
+        mandala.draw = self.counter
+
+        while mandala.current_frame <= self.last_frame:
+            mandala.get_circle_colors()
+            for layer_name in mandala.layer_names:
+                self.counter.layer = layer_name
+                getattr(mandala, layer_name)()
+            mandala.finish_layers()
+            mandala.advance_frame()
+
+    def get_estimate(self):
+        """A method to combine the primitive counts with the cost model."""
+
+        costs = self.cost_model
+        frame_count = self.last_frame - self.first_frame + 1
+        pixel_count = self.mandala.image_side ** 2
+
+        layers = {}
+        for (layer, shape, style), (calls, pixels) in self.counter.counts.items():
+            if shape == 'gradient':
+                call_cost, pixel_cost = 0, costs.gradient_cost
+            else:
+                call_cost, pixel_cost = costs.primitive_costs[(shape, style)]
+            layer_estimate = layers.setdefault(layer, {'primitives': 0, 'seconds': 0})
+            layer_estimate['primitives'] += calls
+            layer_estimate['seconds'] += calls * call_cost + pixels * pixel_cost
+
+        draw_seconds = sum(layer_estimate['seconds'] for layer_estimate in layers.values())
+        effects_seconds = costs.effects_cost * pixel_count * frame_count
+        frame_file_seconds = 0 if self.in_memory else costs.frame_file_cost * pixel_count * frame_count
+        gif_seconds = costs.gif_cost * pixel_count * frame_count
+
+        peak_memory = costs.get_worker_memory(self.mandala) + costs.gif_memory * pixel_count * frame_count
+        if self.in_memory:
+            peak_memory += 4 * pixel_count * frame_count
+
+        return {'frames': [self.first_frame, self.last_frame],
+                'image_side': self.mandala.image_side,
+                'primitives': sum(layer_estimate['primitives'] for layer_estimate in layers.values()),
+                'layers': layers,
+                'seconds': {'draw': draw_seconds,
+                            'effects': effects_seconds,
+                            'frame_files': frame_file_seconds,
+                            'gif': gif_seconds,
+                            'total': draw_seconds + effects_seconds + frame_file_seconds + gif_seconds},
+                'peak_memory': int(peak_memory),
+                'frame_files_size': 0 if self.in_memory else int(costs.frame_file_size * pixel_count * frame_count),
+                'gif_size': int(costs.gif_size * pixel_count * frame_count)}
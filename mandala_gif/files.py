@@ -0,0 +1,126 @@
+# files.py - Saving the frames, the GIF and render checkpoints.
+
+import json
+import os
+from pathlib import Path
+from PIL import Image
+
+from .encoders import get_encoder
+
+
+def get_frame_path(folder_path, frame):
+    """Returns the path a frame is saved to in a folder."""
+
+    return Path(folder_path) / f'Mandala-{frame:02d}.png'
+
+
+def get_frame_paths(folder_path):
+    """Returns the paths of the frames saved in a folder, in frame order.
+
+    Frame numbers are only padded to two digits, so from frame 100 on the file names do not sort in frame order.
+    """
+
+    paths = [path for path in Path(folder_path).glob('Mandala-[0-9]*.png') if path.stem[8:].isdigit()]
+    return sorted(paths, key=lambda path: int(path.stem[8:]))
+
+
+class GifCreator:
+    """Overall class to create the GIF, or another animation format, from the image frames."""
+
+    def __init__(self, output_path='Mandala-GIF.gif', frames_dir='.', create_gif=True, encoder='gif',
+                 **encoder_options):
+        """A method to control settings for the GIF, as well as run all class methods."""
+
+        self.frame_duration = 0.08
+        self.output_path = output_path
+        self.frames_dir = Path(frames_dir)
+        self.encoder = get_encoder(encoder, frame_duration=self.frame_duration, **encoder_options)
+
+        if create_gif:
+            self.create_gif()
+
+    def create_gif(self, images=None):
+        """A method to create the GIF, from the frames folder unless images are given."""
+
+        print("\nCreating the GIF. (Almost done...)")
+
+        if images is None:
+            images = (Image.open(path) for path in get_frame_paths(self.frames_dir))
+        self.write_gif(self.output_path, images)
+        print("\nGIF created!")
+
+    def write_gif(self, target, images):
+        """A method to write images to a GIF file name or file object, using the chosen encoder."""
+
+        self.encoder.write(target, images)
+
+
+class DeleteImages:
+    """A class to delete the image frames from a folder."""
+
+    def __init__(self, folder_path='.'):
+
+        for path in get_frame_paths(folder_path):
+            path.unlink()
+
+
+def save_atomically(path, save):
+    """Writes a file through a temporary file next to it, so the file is either complete or missing."""
+
+    path = Path(path)
+    temporary_path = path.with_name(path.name + '.partial')
+    with open(temporary_path, 'wb') as file:
+        save(file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+
+
+class Checkpoint:
+    """A class to record which frames of a render are finished, so an interrupted render can be resumed."""
+
+    file_name = 'Mandala-checkpoint.json'
+
+    def __init__(self, folder_path, settings):
+        """A method to prepare the checkpoint for a folder of frames drawn with the given settings."""
+
+        self.folder_path = Path(folder_path)
+        self.path = self.folder_path / self.file_name
+        self.settings = settings
+        self.finished_frames = []
+
+    def load(self, resume):
+        """A method to read the checkpoint, returning the first frame that still needs drawing."""
+
+        if not self.path.exists():
+            return 1
+        if not resume:
+            raise ValueError(f"{self.folder_path} holds an unfinished render, "
+                             f"use --resume to carry on with it or choose another folder")
+
+        checkpoint = json.loads(self.path.read_text())
+        if checkpoint['settings'] != self.settings:
+            changed_settings = sorted(name for name in set(checkpoint['settings']) | set(self.settings)
+                                      if checkpoint['settings'].get(name) != self.settings.get(name))
+            raise ValueError(f"Cannot resume, these settings differ from the checkpoint: "
+                             f"{', '.join(changed_settings)}")
+
+        # Only carry on after the frames that are finished and still on disk.
+        for frame in sorted(checkpoint['finished_frames']):
+            if frame != len(self.finished_frames) + 1 or not get_frame_path(self.folder_path, frame).exists():
+                break
+            self.finished_frames.append(frame)
+
+        return len(self.finished_frames) + 1
+
+    def add_frame(self, frame):
+        """A method to record a finished frame."""
+
+        self.finished_frames.append(frame)
+        checkpoint = json.dumps({'settings': self.settings, 'finished_frames': self.finished_frames})
+        save_atomically(self.path, lambda file: file.write(checkpoint.encode()))
+
+    def delete(self):
+        """A method to remove the checkpoint once the render is finished."""
+
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,37 @@
+# gradients.py - Builds stepped color gradients as NumPy arrays instead of drawing them line by line.
+
+from PIL import Image
+
+
+def get_square_gradient_tile(colors, tile_size, center):
+    """Returns one background tile, colored by each pixel's Chebyshev distance from the center.
+
+    This matches drawing a 1px square outline in colors[num] at every distance num from the center,
+    from the inside out, as draw_background_square does.
+    """
+
+    import numpy as np
+
+    offsets = np.abs(np.arange(tile_size) - center)
+    distances = np.maximum(offsets[:, np.newaxis], offsets[np.newaxis, :])
+    # ImageDraw clips color values above 255, so the colors are clipped the same way.
+    palette = np.clip(np.array(colors), 0, 255).astype(np.uint8)
+    return palette[distances]
+
+
+def get_square_gradient_image(colors, tile_size, center, image_side, box=None, scale=1):
+    """Returns the tiled square gradient background as an image, or only the box of it at the given scale."""
+
+    import numpy as np
+
+    tile = get_square_gradient_tile(colors, tile_size, center)
+    tile_count = -(-image_side // tile_size)
+    pixels = np.tile(tile, (tile_count, tile_count, 1))[:image_side, :image_side]
+    image = Image.fromarray(np.ascontiguousarray(pixels), 'RGB')
+
+    if box is not None:
+        # Each pixel of the region takes the color of the full image pixel it falls in.
+        left, top, right, bottom = box
+        image = image.crop(box).resize((max(1, round((right - left) * scale)), max(1, round((bottom - top) * scale))),
+                                       Image.NEAREST)
+    return image
@@ -0,0 +1,1217 @@
+# mandala.py - Draws each frame of the mandala using Pillow.
+
+from PIL import Image, ImageDraw, ImageFilter, ImageOps
+
+from .draw import RegionDraw
+from .effects import apply_filter_to_boxes, get_blur_support, get_box_area, get_changed_boxes, grow_box
+from .files import get_frame_path, save_atomically
+from .gradients import get_square_gradient_image
+
+
+class Mandala:
+    """Overall class to create the mandala."""
+
+    # Settings that can be overridden when creating a Mandala.
+    setting_names = ('image_side', 'frame_count', 'background_pattern_count', 'border_circle_divisor',
+                     'circle_hue_count', 'circle_shrink', 'circle_line_distance', 'circle_line_width',
+                     'circle_horizontal_stretch', 'circle_vertical_stretch', 'spoke_spin_clockwise',
+                     'spoke_spin_counterclockwise', 'posterize_bits', 'grey_hue_count', 'green_hue_count',
+                     'gold_hue_count')
+
+    # The settings that must be whole numbers, and the smallest value each can take. The hue counts must leave
+    # enough colors for the design, which picks tones as far along each color list as the 20th, and the circle
+    # hue count only turns back at 10 on its way down if it starts there or above.
+    setting_minimums = {'image_side': 1, 'frame_count': 1, 'background_pattern_count': 1, 'border_circle_divisor': 3,
+                        'circle_hue_count': 10, 'grey_hue_count': 20, 'green_hue_count': 20, 'gold_hue_count': 20,
+                        'posterize_bits': 1}
+
+    # The border around the circle is 30 rings, 4 pixels apart, so the circle must be at least this many pixels across.
+    min_circle_size = 232
+
+    # The layers drawn in each frame, from back to front.
+    layer_names = ('draw_background', 'draw_border_circles', 'draw_border_circle_halos', 'draw_circle',
+                   'draw_long_spokes', 'draw_circle_border', 'draw_gate_platforms', 'draw_gate_objects',
+                   'draw_short_spokes', 'draw_squares', 'draw_box_arcs', 'draw_inner_square_pattern',
+                   'draw_square_outlines', 'draw_center_shape', 'draw_image_heart')
+
+    # Quality presets, trading detail for speed. The scale is the size of the frames compared with image_side,
+    # supersample draws each frame that many times larger and shrinks it back down to smooth the edges,
+    # and detail_step only draws every so many rings and pattern lines.
+    presets = {'draft': {'scale': 0.5, 'supersample': 1, 'unsharp_mask': False, 'detail_step': 2},
+               'standard': {'scale': 1, 'supersample': 1, 'unsharp_mask': True, 'detail_step': 1},
+               'final': {'scale': 1, 'supersample': 2, 'unsharp_mask': True, 'detail_step': 1}}
+
+    # Whether the background gradient is built as a NumPy array, rather than drawn one square outline at a time.
+    gradient_arrays = True
+
+    # Whether the unsharp mask is only applied again to the parts of a frame that changed since the last one,
+    # the size of the tiles compared, and the largest share of the frame refiltered that way before it is
+    # quicker to filter the whole frame.
+    dirty_effects = True
+    effects_tile_size = 32
+    dirty_area_limit = 0.5
+
+    def __init__(self, settings=None, layer_cache=None, output_dir=None, preset='standard', layer_pool=None,
+                 canvas=True):
+        """A method to control image settings and prepare the colors, without drawing anything yet.
+
+        A LayerPool, when given, draws each frame's layers and unsharp mask on several CPUs at once.
+        Without a canvas no image is made, so the layers can be drawn on a stand-in such as PrimitiveCounter.
+        """
+
+        self.image_side = 1600
+        self.frame_count = 30
+
+        self.background_pattern_count = 8
+
+        self.border_circle_divisor = 16
+        self.circle_hue_count = 11
+        self.circle_shrink = 1
+        self.circle_line_distance = 5
+        self.circle_line_width = 2
+        self.circle_horizontal_stretch = 1
+        self.circle_vertical_stretch = 1
+        self.spoke_spin_clockwise = 0
+        self.spoke_spin_counterclockwise = 0
+
+        # Image effect settings
+        self.posterize_bits = 8
+        self.unsharp_mask_radius = 7
+
+        # Color variables
+        self.grey_hue_count = 24
+        self.green_hue_count = 24
+        self.gold_hue_count = 24
+
+        # Override the default settings with any settings passed in.
+        self.apply_settings(settings)
+        self.settings = {name: getattr(self, name) for name in self.setting_names}
+
+        if preset not in self.presets:
+            raise ValueError(f"Unknown preset {preset!r}, choose from {', '.join(self.presets)}")
+        self.preset = preset
+        self.render_scale = self.presets[preset]['scale']
+        self.supersample = self.presets[preset]['supersample']
+        self.unsharp_mask = self.presets[preset]['unsharp_mask']
+        self.detail_step = self.presets[preset]['detail_step']
+
+        # Color lists
+        self.background_colors = []
+        self.circle_colors = []
+        self.grey_tones = []
+        self.green_tones = []
+        self.gold_tones = []
+
+        # GIF frame variables
+        self.gif_frames = self.frame_count + 1
+        self.current_frame = 1
+
+        # Background variables
+        self.background_pattern_size = int(self.image_side / self.background_pattern_count)
+        self.background_hue_count = int(self.background_pattern_size / 2)
+
+        # Circle variables
+        self.image_center = int(self.image_side / 2)
+        self.circle_size = self.image_side - (self.image_side / self.border_circle_divisor * 2)
+        self.circle_radius = self.circle_size / 2
+        self.circle_to_image_edge = self.image_side / self.border_circle_divisor
+        self.circle_line_width_growth = 1
+        self.circle_hue_count_growth = 1
+
+        # Shape variables
+        self.shape_width = self.circle_size / 3
+        self.shape_ints = [self.shape_width / 2,
+                           self.shape_width / 16,
+                          (self.shape_width / 2) + (self.shape_width / 8),
+                           self.shape_width / 6,
+                           self.shape_width - (self.shape_width / 4)]
+
+        self.platform_int = self.image_center - self.shape_ints[4] - (self.shape_ints[1] * 3.5) \
+                            + ((self.shape_ints[4] - self.shape_ints[2]) / 3)
+
+        # Spoke variables
+        self.square_width = (self.shape_ints[4] + self.shape_ints[1]) * 2
+        self.square_diagonal_squared = (self.square_width ** 2) + (self.square_width ** 2)
+        self.square_diagonal = self.square_diagonal_squared ** 0.5
+
+        # Inner square pattern variables.
+        self.inner_square_pattern_stretch = 10
+        self.inner_square_pattern_growth = 1
+
+        # Border circle variables
+        self.halo_spin_clockwise = 0
+        self.halo_spin_counterclockwise = 0
+        self.halo_spin_direction = 0
+
+        # Create a list of settings.
+        self.settings_list = [self.background_pattern_count,
+                              self.border_circle_divisor,
+                              self.circle_shrink,
+                              self.circle_line_distance,
+                              self.circle_horizontal_stretch,
+                              self.circle_vertical_stretch]
+
+        # Folder the frames are saved in. Without one, the frames are kept in memory instead.
+        self.output_dir = output_dir
+        self.frames = []
+
+        # The region, image and sharpened image of the last frame, for reusing its unsharp mask, and the boxes the
+        # unsharp mask was applied to again in the last frame, or None when the whole frame was filtered.
+        self.previous_effects = None
+        self.effects_boxes = None
+
+        self.layer_pool = layer_pool
+
+        # Layers that stay the same between frames, shared between Mandala instances when a cache is passed in.
+        if layer_cache is None:
+            layer_cache = {}
+        self.layer_cache = layer_cache
+
+        # Create image object. The region is the box and scale being drawn, when it is not the full image.
+        if canvas:
+            self.make_canvas((0, 0, self.image_side, self.image_side), self.render_scale)
+        else:
+            self.image, self.draw, self.region, self.image_scale = None, None, None, self.render_scale
+
+        # self.make_directory()
+
+        # Create an instance of the image.
+        self.get_background_colors()
+
+        self.get_grey_tones()
+        self.get_green_tones()
+        self.get_gold_tones()
+
+    def apply_settings(self, settings):
+        """A method to override the default image settings."""
+
+        if not settings:
+            return
+
+        for name, value in settings.items():
+            if name not in self.setting_names:
+                raise ValueError(f"Unknown setting: {name}")
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise ValueError(f"Setting {name} must be a number, not {value!r}")
+            if name in self.setting_minimums:
+                if not isinstance(value, int):
+                    raise ValueError(f"Setting {name} must be a whole number, not {value!r}")
+                if value < self.setting_minimums[name]:
+                    raise ValueError(f"Setting {name} must be at least {self.setting_minimums[name]}, not {value!r}")
+            setattr(self, name, value)
+
+        if self.posterize_bits > 8:
+            raise ValueError(f"Setting posterize_bits must be at most 8, not {self.posterize_bits!r}")
+        if self.background_pattern_count > self.image_side:
+            raise ValueError(f"Setting background_pattern_count must be at most image_side ({self.image_side}), "
+                             f"not {self.background_pattern_count!r}")
+        min_image_side = -(-self.min_circle_size * self.border_circle_divisor // (self.border_circle_divisor - 2))
+        if self.image_side < min_image_side:
+            raise ValueError(f"Setting image_side must be at least {min_image_side} with a border_circle_divisor of "
+                             f"{self.border_circle_divisor}, to leave room for the circle border")
+
+    def make_canvas(self, box, scale):
+        """A method to create the image drawn on, covering a box of the full image at the given scale."""
+
+        left, top, right, bottom = box
+        draw_scale = scale * self.supersample
+        self.image = Image.new('RGB', (max(1, round((right - left) * draw_scale)),
+                                       max(1, round((bottom - top) * draw_scale))))
+        self.image_scale = scale
+
+        if box == (0, 0, self.image_side, self.image_side) and draw_scale == 1:
+            self.draw = ImageDraw.Draw(self.image)
+            self.region = None
+        else:
+            self.draw = RegionDraw(self.image, box, draw_scale)
+            self.region = (box, draw_scale)
+
+    def create_frames(self, checkpoint=None):
+        """A method to draw and save every frame of the GIF, from the current frame on."""
+
+        while self.current_frame < self.gif_frames:
+            self.draw_frame()
+
+            self.save_image()
+            if checkpoint is not None:
+                checkpoint.add_frame(self.current_frame)
+
+            self.advance_frame()
+
+    def draw_frame(self):
+        """A method to draw the current frame and apply the image effects."""
+
+        if self.layer_pool is not None:
+            self.layer_pool.draw_layers(self)
+        else:
+            self.get_circle_colors()
+            for layer_name in self.layer_names:
+                getattr(self, layer_name)()
+
+        self.finish_layers()
+        self.apply_image_effects()
+
+    def finish_layers(self):
+        """A method to leave the mandala as drawing every layer of the current frame does, whichever were drawn.
+
+        Skipped frames, and frames whose layers are drawn in other processes, use this to stay in step.
+        """
+
+        # Drawing the border circle halos always leaves the spin direction at 1.
+        self.halo_spin_direction = 1
+        self.change_posterize_bits()
+
+    def advance_frame(self):
+        """A method to move the animation on to the next frame."""
+
+        self.change_border_circle_halo_position()
+        self.change_circle_hue_count()
+        self.change_circle_line_width()
+        self.change_spoke_position()
+        self.change_inner_square_pattern_stretch()
+
+        self.change_current_frame()
+
+        self.reset_settings()
+
+    def skip_frame(self):
+        """A method to move past the current frame without drawing it."""
+
+        self.get_circle_colors()
+        self.finish_layers()
+        self.advance_frame()
+
+    def seek_frame(self, frame):
+        """A method to move the animation forward to the given frame."""
+
+        if not self.current_frame <= frame <= self.frame_count:
+            raise ValueError(f"Cannot seek from frame {self.current_frame} to frame {frame} "
+                             f"of {self.frame_count}")
+
+        while self.current_frame < frame:
+            self.skip_frame()
+
+    def render_region(self, frame, box, scale=1):
+        """A method to draw only the part of a frame inside a box, scaled by the given amount.
+
+        Primitives that miss the box are skipped, and the frame is left behind like create_frames does,
+        so only the current frame or a later one can be drawn next.
+        """
+
+        left, top, right, bottom = box
+        if not 0 <= left < right <= self.image_side or not 0 <= top < bottom <= self.image_side:
+            raise ValueError(f"Region {box} is not inside the {self.image_side}x{self.image_side} image")
+        if scale <= 0:
+            raise ValueError("The region scale must be more than 0")
+
+        # Draw a margin around the box, as wide as the unsharp mask reaches, so the mask is the same at its edges
+        # as in the full image.
+        margin = int(-(-get_blur_support(self.unsharp_mask_radius * scale) // scale))
+        padded_box = (max(0, left - margin), max(0, top - margin),
+                      min(self.image_side, right + margin), min(self.image_side, bottom + margin))
+
+        self.seek_frame(frame)
+
+        image, draw, region, image_scale = self.image, self.draw, self.region, self.image_scale
+        self.make_canvas(padded_box, scale)
+        try:
+            self.draw_frame()
+            self.advance_frame()
+        finally:
+            self.image, self.draw, self.region, self.image_scale = image, draw, region, image_scale
+
+        return self.image_effects.crop((round((left - padded_box[0]) * scale),
+                                        round((top - padded_box[1]) * scale),
+                                        round((right - padded_box[0]) * scale),
+                                        round((bottom - padded_box[1]) * scale)))
+
+    def get_background_colors(self):
+        """A method to prepare the colors used in the background."""
+
+        bg_start_color = [0, 0, 10]
+
+        self.background_colors.append((bg_start_color[0], bg_start_color[1], bg_start_color[2]))
+
+        for i in range(self.background_hue_count):
+            bg_start_color[0] += 0
+            bg_start_color[1] += 1
+            bg_start_color[2] += 1
+            self.background_colors.append((bg_start_color[0], bg_start_color[1], bg_start_color[2]))
+
+    def get_circle_colors(self):
+        """A method to prepare the colors used in the foreground circle."""
+
+        circle_start_color = [200, 100, 100]
+        circle_end_color = [200, 350, 155]
+        circle_color_increment = [(circle_end_color[0] - circle_start_color[0]) / self.circle_hue_count,
+                                  (circle_end_color[1] - circle_start_color[1]) / self.circle_hue_count,
+                                  (circle_end_color[2] - circle_start_color[2]) / self.circle_hue_count]
+
+        self.circle_colors.append((circle_start_color[0], circle_start_color[1], circle_start_color[2]))
+
+        for i in range(self.circle_hue_count):
+            circle_start_color[0] += circle_color_increment[0]
+            circle_start_color[1] += circle_color_increment[1]
+            circle_start_color[2] += circle_color_increment[2]
+            self.circle_colors.append((int(circle_start_color[0]), int(circle_start_color[1]), int(circle_start_color[2])))
+
+    def get_grey_tones(self):
+        """A method to create a grey color tone set."""
+
+        grey_start_color = [10, 20, 30]
+        grey_end_color = [70, 120, 140]
+        grey_increment = [(grey_end_color[0] - grey_start_color[0]) / self.grey_hue_count,
+                          (grey_end_color[1] - grey_start_color[1]) / self.grey_hue_count,
+                          (grey_end_color[2] - grey_start_color[2]) / self.grey_hue_count]
+
+        self.grey_tones.append((grey_start_color[0], grey_start_color[1], grey_start_color[2]))
+
+        for i in range(self.grey_hue_count):
+            grey_start_color[0] += grey_increment[0]
+            grey_start_color[1] += grey_increment[1]
+            grey_start_color[2] += grey_increment[2]
+            self.grey_tones.append((int(grey_start_color[0]), int(grey_start_color[1]), int(grey_start_color[2])))
+
+    def get_green_tones(self):
+        """A method to create a grey color tone set."""
+
+        green_start_color = [50, 65, 50]
+        green_end_color = [80, 120, 80]
+        green_increment = [(green_end_color[0] - green_start_color[0]) / self.green_hue_count,
+                          (green_end_color[1] - green_start_color[1]) / self.green_hue_count,
+                          (green_end_color[2] - green_start_color[2]) / self.green_hue_count]
+
+        self.green_tones.append((green_start_color[0], green_start_color[1], green_start_color[2]))
+
+        for i in range(self.green_hue_count):
+            green_start_color[0] += green_increment[0]
+            green_start_color[1] += green_increment[1]
+            green_start_color[2] += green_increment[2]
+            self.green_tones.append((int(green_start_color[0]), int(green_start_color[1]), int(green_start_color[2])))
+
+    def get_gold_tones(self):
+        """A method to create a grey color tone set."""
+
+        gold_start_color = [150, 140, 20]
+        gold_end_color = [240, 230, 180]
+        gold_increment = [(gold_end_color[0] - gold_start_color[0]) / self.gold_hue_count,
+                          (gold_end_color[1] - gold_start_color[1]) / self.gold_hue_count,
+                          (gold_end_color[2] - gold_start_color[2]) / self.gold_hue_count]
+
+        self.gold_tones.append((gold_start_color[0], gold_start_color[1], gold_start_color[2]))
+
+        for i in range(self.gold_hue_count):
+            gold_start_color[0] += gold_increment[0]
+            gold_start_color[1] += gold_increment[1]
+            gold_start_color[2] += gold_increment[2]
+            self.gold_tones.append((int(gold_start_color[0]), int(gold_start_color[1]), int(gold_start_color[2])))
+
+    def draw_background_square(self, i, j):
+        """A method to draw the reoccurring sqaure pattern in the background."""
+
+        num = 0
+        while num < 1:
+            for color in self.background_colors:
+                self.draw.rectangle([((i + self.background_hue_count) - num, (j + self.background_hue_count) - num),
+                                     ((i + self.background_hue_count) + num, (j + self.background_hue_count) + num)],
+                                    outline=color, width=1)
+                num += 1
+
+    def draw_background(self):
+        """A method to draw the full background, reusing it from the layer cache when possible."""
+
+        cache_key = ('background', self.image_side, self.background_pattern_count, self.region,
+                     self.gradient_arrays)
+        background = self.layer_cache.get(cache_key)
+        if self.image is None:
+            # Without a canvas, the background is counted once on the stand-in, as a render builds it once.
+            if cache_key not in self.layer_cache:
+                self.layer_cache[cache_key] = None
+                if self.gradient_arrays:
+                    self.draw.square_gradient((0, 0, self.image_side, self.image_side))
+                else:
+                    for i in range(0, self.image_side, self.background_pattern_size):
+                        for j in range(0, self.image_side, self.background_pattern_size):
+                            self.draw_background_square(i, j)
+        elif background is not None:
+            self.image.paste(background)
+        elif self.gradient_arrays:
+            box, scale = self.region or (None, 1)
+            background = get_square_gradient_image(self.background_colors, self.background_pattern_size,
+                                                   self.background_hue_count, self.image_side, box, scale)
+            self.image.paste(background)
+            self.layer_cache[cache_key] = background
+        else:
+            for i in range(0, self.image_side, self.background_pattern_size):
+                for j in range(0, self.image_side, self.background_pattern_size):
+                    self.draw_background_square(i, j)
+            self.layer_cache[cache_key] = self.image.copy()
+
+    def draw_single_border_circle(self, nw_x, nw_y, se_x, se_y, border_circle_shrink, line_distance, line_width):
+        """Draws a single central circle of the border circles."""
+
+        for i in range(0, int(self.circle_hue_count)):
+            for color in self.gold_tones[12:24]:
+                if nw_x + border_circle_shrink > se_x - border_circle_shrink:
+                    # The remaining circles would be smaller than a single point.
+                    return
+                self.draw.ellipse((nw_x + border_circle_shrink, nw_y + border_circle_shrink,
+                                   se_x - border_circle_shrink, se_y - border_circle_shrink),
+                                  outline=color, width=line_width)
+                border_circle_shrink += line_distance * self.detail_step
+
+    def draw_border_circles(self):
+        """A method that calls the function draw_single_border_circle to draw all four border circles."""
+
+        ints = [self.circle_to_image_edge / 2,
+                self.circle_to_image_edge * 2,
+                self.circle_to_image_edge * 2.5]
+
+        self.draw_single_border_circle(ints[0], ints[0], ints[0] + ints[1],
+                                       ints[0] + ints[1],
+                                       1, 3, 1)
+        self.draw_single_border_circle(self.image_side - ints[2], self.image_side - ints[2],
+                                       self.image_side - ints[0], self.image_side - ints[0],
+                                       1, 3, 1)
+        self.draw_single_border_circle(self.image_side - ints[2], ints[0],
+                                       self.image_side - ints[0], ints[0] + ints[1],
+                                       1, 3, 1)
+        self.draw_single_border_circle(ints[0], self.image_side - ints[2],
+                                       ints[0] + ints[1], self.image_side - ints[0],
+                                       1, 3, 1)
+
+    def change_halo_spin_direction(self):
+        if self.halo_spin_direction == 0:
+            self.halo_spin_direction = 1
+        elif self.halo_spin_direction == 1:
+            self.halo_spin_direction = 0
+
+    def draw_border_circle_halos(self):
+        """A method to draw the halos surrounding each border circle."""
+
+        arc_angles = [0, 60]
+
+        arc_ints = [10, 15, 19, 22, 25]
+        arc_ints_index = 0
+
+        arc_inc = [0, 8, 12, 15, 19]
+        arc_inc_index = 0
+
+        green_tones = []
+        green_tones_list = [12, 9, 6, 4, 2]
+        for num in green_tones_list:
+            green_tones.append(self.green_tones[num])
+        green_tones_index = 0
+
+        line_width = [5, 4, 3, 2, 2]
+        line_width_index = 0
+
+        spin_direction = [self.halo_spin_clockwise, self.halo_spin_counterclockwise]
+
+        for i in range(3):
+            # This loop draws one-third of the halos around each border circle,
+            # drawing another one-third upon each iteration.
+
+            for j in range(4):
+                # This loop draws one-third of the halos around each border circle,
+                # adding another ring outward upon each iteration.
+
+                # Upper left border circle halos
+                self.draw.arc((self.circle_to_image_edge / 2 - arc_ints[arc_ints_index],
+                               self.circle_to_image_edge / 2 - arc_ints[arc_ints_index],
+                               self.circle_to_image_edge * 2.5 + arc_ints[arc_ints_index],
+                               self.circle_to_image_edge * 2.5 + arc_ints[arc_ints_index]),
+                              arc_angles[0] + arc_inc[arc_inc_index] + spin_direction[self.halo_spin_direction],
+                              arc_angles[1] - arc_inc[arc_inc_index] + spin_direction[self.halo_spin_direction],
+                              fill=green_tones[green_tones_index],
+                              width=line_width[line_width_index])
+                arc_ints_index += 1
+                arc_inc_index += 1
+                green_tones_index += 1
+                line_width_index += 1
+                self.change_halo_spin_direction()
+
+            arc_ints_index = 0
+            arc_inc_index = 0
+            green_tones_index = 0
+            line_width_index = 0
+            self.halo_spin_direction = 0
+
+            for j in range(4):
+
+                # Upper right border circle halos
+                self.draw.arc((self.image_side - self.circle_to_image_edge * 2.5 - arc_ints[arc_ints_index],
+                               self.circle_to_image_edge / 2 - arc_ints[arc_ints_index],
+                               self.image_side - self.circle_to_image_edge / 2 + arc_ints[arc_ints_index],
+                               self.circle_to_image_edge * 2.5 + arc_ints[arc_ints_index]),
+                              arc_angles[0] + arc_inc[arc_inc_index] + spin_direction[self.halo_spin_direction],
+                              arc_angles[1] - arc_inc[arc_inc_index] + spin_direction[self.halo_spin_direction],
+                              fill=green_tones[green_tones_index],
+                              width=line_width[line_width_index])
+                arc_ints_index += 1
+                arc_inc_index += 1
+                green_tones_index += 1
+                line_width_index += 1
+                self.change_halo_spin_direction()
+
+            arc_ints_index = 0
+            arc_inc_index = 0
+            green_tones_index = 0
+            line_width_index = 0
+            self.halo_spin_direction = 1
+
+            for j in range(4):
+
+                # Bottom right border circle halos
+                self.draw.arc((self.image_side - self.circle_to_image_edge * 2.5 - arc_ints[arc_ints_index],
+                               self.image_side - self.circle_to_image_edge * 2.5 - arc_ints[arc_ints_index],
+                               self.image_side - self.circle_to_image_edge / 2 + arc_ints[arc_ints_index],
+                               self.image_side - self.circle_to_image_edge / 2 + arc_ints[arc_ints_index]),
+                              arc_angles[0] + arc_inc[arc_inc_index] + spin_direction[self.halo_spin_direction],
+                              arc_angles[1] - arc_inc[arc_inc_index] + spin_direction[self.halo_spin_direction],
+                              fill=green_tones[green_tones_index],
+                              width=line_width[line_width_index])
+                arc_ints_index += 1
+                arc_inc_index += 1
+                green_tones_index += 1
+                line_width_index += 1
+                self.change_halo_spin_direction()
+
+            arc_ints_index = 0
+            arc_inc_index = 0
+            green_tones_index = 0
+            line_width_index = 0
+            self.halo_spin_direction = 0
+
+            for j in range(4):
+
+                # Bottom left border circle halos
+                self.draw.arc((self.circle_to_image_edge / 2 - arc_ints[arc_ints_index],
+                               self.image_side - self.circle_to_image_edge * 2.5 - arc_ints[arc_ints_index],
+                               self.circle_to_image_edge * 2.5 + arc_ints[arc_ints_index],
+                               self.image_side - self.circle_to_image_edge / 2 + arc_ints[arc_ints_index]),
+                              arc_angles[0] + arc_inc[arc_inc_index] + spin_direction[self.halo_spin_direction],
+                              arc_angles[1] - arc_inc[arc_inc_index] + spin_direction[self.halo_spin_direction],
+                              fill=green_tones[green_tones_index],
+                              width=line_width[line_width_index])
+                arc_ints_index += 1
+                arc_inc_index += 1
+                green_tones_index += 1
+                line_width_index += 1
+                self.change_halo_spin_direction()
+
+            arc_ints_index = 0
+            arc_inc_index = 0
+            green_tones_index = 0
+            line_width_index = 0
+            self.halo_spin_direction = 1
+
+            arc_angles[0] += 120
+            arc_angles[1] += 120
+
+    def draw_circle(self):
+        """Draws the central image."""
+
+        for i in range(0, int(self.circle_size)):
+            for color in reversed(self.circle_colors):
+                if self.circle_shrink > self.circle_radius * min(self.circle_horizontal_stretch,
+                                                                 self.circle_vertical_stretch):
+                    # The remaining circles would be smaller than a single point.
+                    return
+                self.draw.ellipse((
+                    # Upper-left corner of ellipse box x-axis.
+                    self.circle_to_image_edge
+                    + (self.circle_shrink / self.circle_horizontal_stretch),
+                    # Upper-left corner of ellipse box y-axis.
+                    self.circle_to_image_edge
+                    + (self.circle_shrink / self.circle_vertical_stretch),
+                    # Bottom-right corner of ellipse box x-axis.
+                    (self.image_side - self.circle_to_image_edge)
+                    - (self.circle_shrink / self.circle_horizontal_stretch),
+                    # Bottom-right corner of ellipse box y-axis.
+                    (self.image_side - self.circle_to_image_edge)
+                    - (self.circle_shrink / self.circle_vertical_stretch)),
+                    outline=color, width=self.circle_line_width)
+                self.circle_shrink += self.circle_line_distance * self.detail_step
+
+    def draw_long_spokes(self):
+        """A method to draw the long spokes that move clockwise."""
+
+        long_spoke_angle = 0
+        for i in range(0, 12):
+            self.draw.pieslice([(self.circle_to_image_edge, self.circle_to_image_edge),
+                                (self.image_side - self.circle_to_image_edge,
+                                 self.image_side - self.circle_to_image_edge)],
+                               0 + long_spoke_angle + self.spoke_spin_clockwise,
+                               2 + long_spoke_angle + self.spoke_spin_clockwise,
+                               fill=self.grey_tones[10])
+            long_spoke_angle += 30
+
+    def draw_short_spokes(self):
+        """A method to draw the short spokes that move counter-clockwise."""
+
+        short_spoke_angle = 15
+        short_spoke_starting_point = self.image_center - (self.square_diagonal / 2)
+        for i in range(0, 12):
+            self.draw.pieslice([(short_spoke_starting_point, short_spoke_starting_point),
+                                (self.image_side - short_spoke_starting_point,
+                                 self.image_side - short_spoke_starting_point)],
+                               0 + short_spoke_angle + self.spoke_spin_counterclockwise,
+                               4 + short_spoke_angle + self.spoke_spin_counterclockwise,
+                               fill=self.grey_tones[5])
+            short_spoke_angle += 30
+
+    def draw_single_square(self, distance_from_center, color_set, color):
+        """A method to define one of the squares."""
+
+        ints = []
+        for i in range(1):
+            ints.append(self.image_center - distance_from_center)
+            ints.append(self.image_center + distance_from_center)
+
+        self.draw.polygon(((ints[0], ints[0]), (ints[1], ints[0]),
+                           (ints[1], ints[1]), (ints[0], ints[1])),
+                          fill=color_set[color])
+
+    def draw_squares(self):
+        """A method to draw all the squares."""
+
+        self.draw_single_square(self.shape_ints[4] + self.shape_ints[1], self.grey_tones, 6)
+        self.draw_single_square(self.shape_ints[4], self.gold_tones, 18)
+        self.draw_single_square(self.shape_ints[4] - ((self.shape_ints[4] - self.shape_ints[2]) / 3), self.grey_tones, 12)
+        self.draw_single_square(self.shape_ints[4] - ((self.shape_ints[4] - self.shape_ints[2]) / 1.5), self.gold_tones, 18)
+        self.draw_single_square(self.shape_ints[2], self.grey_tones, 6)
+
+    def draw_square_outline(self, distance_from_center, color, border_width):
+        """A method to define one of the square outlines. """
+
+        ints = []
+        for i in range(1):
+            ints.append(self.image_center - distance_from_center)
+            ints.append(self.image_center + distance_from_center)
+
+        self.draw.line([(ints[0], ints[0]), (ints[1], ints[0]), (ints[1], ints[1]),
+                        (ints[0], ints[1]), (ints[0], ints[0])],
+                       fill=self.grey_tones[color], width=border_width)
+
+    def draw_square_outlines(self):
+        """A method to draw all the square outlines."""
+
+        self.draw_square_outline(self.shape_ints[4] + self.shape_ints[1], 0, 3)
+        self.draw_square_outline(self.shape_ints[4], 0, 3)
+        self.draw_square_outline(self.shape_ints[4] - ((self.shape_ints[4] - self.shape_ints[2]) / 3), 0, 3)
+        self.draw_square_outline(self.shape_ints[4] - ((self.shape_ints[4] - self.shape_ints[2]) / (3 / 2)), 0, 3)
+        self.draw_square_outline(self.shape_ints[2], 0, 3)
+
+    def draw_center_shape(self):
+        """A method to draw the shape within the center squares."""
+
+        ints = []
+        for i in range(5):
+            ints.append(self.image_center - self.shape_ints[i])
+        for i in range(5):
+            ints.append(self.image_center + self.shape_ints[i])
+
+        self.draw.polygon((
+            # Top side of the shape.
+            (ints[0], ints[0]), (ints[1], ints[0]), (ints[1], ints[2]), (ints[3], ints[2]), (ints[3], ints[4]),
+            (ints[8], ints[4]), (ints[8], ints[2]), (ints[6], ints[2]), (ints[6], ints[0]),
+            # Right side of the shape.
+            (ints[5], ints[0]), (ints[5], ints[1]), (ints[7], ints[1]), (ints[7], ints[3]), (ints[9], ints[3]),
+            (ints[9], ints[8]), (ints[7], ints[8]), (ints[7], ints[6]), (ints[5], ints[6]),
+            # Bottom side of the shape.
+            (ints[5], ints[5]), (ints[6], ints[5]), (ints[6], ints[7]), (ints[8], ints[7]), (ints[8], ints[9]),
+            (ints[3], ints[9]), (ints[3], ints[7]), (ints[1], ints[7]), (ints[1], ints[5]),
+            # Left side of the shape.
+            (ints[0], ints[5]), (ints[0], ints[6]), (ints[2], ints[6]), (ints[2], ints[8]), (ints[4], ints[8]),
+            (ints[4], ints[3]), (ints[2], ints[3]), (ints[2], ints[1]), (ints[0], ints[1]),
+        ),
+            fill=self.grey_tones[20], outline=self.grey_tones[4])
+
+    def draw_image_heart(self):
+        """A method to draw the innermost object of the image."""
+
+        arc_angle1 = 356
+        arc_angle2 = 4
+        heart_ints = [230, 210, 190, 170, 150]
+        for i in range(12):
+            div_rate = 1
+            speed_increase = 1
+            gold_tone1 = 0
+            gold_tone2 = 8
+            for heart_int in heart_ints:
+                # The outer shell
+                self.draw.arc((self.image_center - heart_int, self.image_center - heart_int,
+                               self.image_center + heart_int, self.image_center + heart_int),
+                              arc_angle1 + (self.spoke_spin_clockwise * speed_increase),
+                              arc_angle2 + (self.spoke_spin_clockwise * speed_increase),
+                              fill=self.gold_tones[gold_tone1], width=10)
+                self.draw.arc((self.image_center - heart_int + 10, self.image_center - heart_int + 10,
+                               self.image_center + heart_int - 10, self.image_center + heart_int - 10),
+                              arc_angle1 + (self.spoke_spin_counterclockwise * speed_increase),
+                              arc_angle2 + (self.spoke_spin_counterclockwise * speed_increase),
+                              fill=self.gold_tones[gold_tone2], width=10)
+                speed_increase += 1
+                gold_tone1 += 3
+                gold_tone2 += 3
+            for j in range(5):
+                # The horizontal ellipse
+                self.draw.arc((self.image_center - 120 * div_rate, self.image_center - 40 * div_rate,
+                               self.image_center + 120 * div_rate, self.image_center + 40 * div_rate),
+                              arc_angle1 + self.spoke_spin_clockwise * 2,
+                              arc_angle2 + self.spoke_spin_clockwise * 2,
+                              fill=self.grey_tones[16], width=5)
+                self.draw.arc((self.image_center - 90 * div_rate, self.image_center - 25 * div_rate,
+                               self.image_center + 90 * div_rate, self.image_center + 25 * div_rate),
+                              arc_angle1 + self.spoke_spin_counterclockwise * 2,
+                              arc_angle2 + self.spoke_spin_counterclockwise * 2,
+                              fill=self.grey_tones[16], width=5)
+                # The vertical ellipse
+                self.draw.arc((self.image_center - 40 * div_rate, self.image_center - 120 * div_rate,
+                               self.image_center + 40 * div_rate, self.image_center + 120 * div_rate),
+                              arc_angle1 + self.spoke_spin_clockwise * 2,
+                              arc_angle2 + self.spoke_spin_clockwise * 2,
+                              fill=self.grey_tones[16], width=5)
+                self.draw.arc((self.image_center - 25 * div_rate, self.image_center - 90 * div_rate,
+                               self.image_center + 25 * div_rate, self.image_center + 90 * div_rate),
+                              arc_angle1 + self.spoke_spin_counterclockwise * 2,
+                              arc_angle2 + self.spoke_spin_counterclockwise * 2,
+                              fill=self.grey_tones[16], width=5)
+                div_rate = div_rate * 0.9
+            arc_angle1 += 30
+            arc_angle2 += 30
+
+    def draw_circle_border(self):
+        """A method to draw the circle border."""
+
+        arc_size = 0
+        fill = 0
+        for i in range(0, 30, 1):
+            self.draw.arc((self.circle_to_image_edge + arc_size,
+                           self.circle_to_image_edge + arc_size,
+                           self.image_side - self.circle_to_image_edge - arc_size,
+                           self.image_side - self.circle_to_image_edge - arc_size),
+                          0, 360, fill=self.green_tones[fill], width=4)
+            arc_size += 4
+            if arc_size % 10 == 0:
+                fill += 4
+
+    def draw_gate_platforms(self):
+        """A method to draw the gates."""
+
+        ints = []
+        for i in range(5):
+            ints.append(self.image_center - self.shape_ints[i])
+        for i in range(5):
+            ints.append(self.image_center + self.shape_ints[i])
+        ints.append(self.shape_ints[4] - self.shape_ints[2])
+
+        color_list = [(35, 20, 20), (45, 24, 24), (55, 28, 28)]
+        num = 1
+        for color in reversed(color_list):
+            # Each step is drawn once, since drawing the same solid rectangle again changes nothing.
+            # Draw the gate platform above the shape.
+            self.draw.rectangle(
+                (ints[3] - (((ints[10]) / 3) * num),
+                 ints[4] - (self.shape_ints[1] * 3.5) + (((ints[10]) / 3) * num),
+                 ints[8] + (((ints[10]) / 3) * num),
+                 ints[4] - self.shape_ints[1]),
+                fill=color)
+            # Draw the gate platform to the right of the shape.
+            self.draw.rectangle(
+                (ints[9] + (self.shape_ints[1] * 1),
+                 ints[3] - (((ints[10]) / 3) * num),
+                 ints[9] + (self.shape_ints[1] * 3.5) - (((ints[10]) / 3) * num),
+                 ints[8] + (((ints[10]) / 3) * num)),
+                fill=color)
+            # Draw the gate platform below the shape.
+            self.draw.rectangle(
+                (ints[3] - (((ints[10]) / 3) * num),
+                 ints[9] + self.shape_ints[1],
+                 ints[8] + (((ints[10]) / 3) * num),
+                 ints[9] + (self.shape_ints[1] * 3.5) - (((ints[10]) / 3) * num)),
+                fill=color)
+            # Draw the gate platform to the left of the shape.
+            self.draw.rectangle(
+                (ints[4] - (self.shape_ints[1] * 3.5) + (((ints[10]) / 3) * num),
+                 ints[3] - (((ints[10]) / 3) * num),
+                 ints[4] - (self.shape_ints[1] * 1),
+                 ints[8] + (((ints[10]) / 3) * num)),
+                fill=color)
+            num += 1
+
+    def draw_gate_objects(self):
+        """A method to draw the objects that sit upon the gate platforms."""
+
+        # The supporting pillar.
+        ints_0 = []
+        for i in range(15, 31, 15):
+            ints_0.append(self.image_center - i)
+        for i in range(15, 31, 15):
+            ints_0.append(self.image_center + i)
+        ints_0.append(self.image_side - self.platform_int)
+        self.draw.rectangle((ints_0[0], self.platform_int - 30, ints_0[2], self.platform_int), fill=self.gold_tones[6])
+        self.draw.rectangle((ints_0[4], ints_0[0], ints_0[4] + 30, ints_0[2]), fill=self.gold_tones[6])
+        self.draw.rectangle((ints_0[0], ints_0[4], ints_0[2], ints_0[4] + 30), fill=self.gold_tones[6])
+        self.draw.rectangle((self.platform_int - 30, ints_0[0], self.platform_int, ints_0[2]), fill=self.gold_tones[6])
+
+        # Shading on the supporting pillar. Every tone of the shading lands on the same lines,
+        # so only the last one, gold_tones[8], is drawn.
+        ints_01 = [self.image_center - 15, self.image_center + 15,
+                   self.platform_int - 30, self.image_side - self.platform_int + 30]
+        color = self.gold_tones[8]
+        self.draw.line((ints_01[0], self.platform_int, ints_01[0], ints_01[2]), fill=color)
+        self.draw.line((self.image_side - self.platform_int, ints_01[0], ints_01[3], ints_01[0]), fill=color)
+        self.draw.line((ints_01[1], self.image_side - self.platform_int, ints_01[1], ints_01[3]), fill=color)
+        self.draw.line((ints_01[2], ints_01[1], self.platform_int, ints_01[1]), fill=color)
+
+        # The large lower bowl.
+        ints_02_list = [28, 60]
+        ints_02 = [self.image_center - 30, self.image_center + 30]
+        for i in ints_02_list:
+            ints_02.append(self.platform_int - i)
+            ints_02.append(self.image_side - self.platform_int + i)
+
+        self.draw.chord((ints_02[0], ints_02[4], ints_02[1], ints_02[2]),
+                        360, 180, fill=self.gold_tones[4])
+        self.draw.chord((ints_02[3], ints_02[0], ints_02[5], ints_02[1]),
+                        90, 270, fill=self.gold_tones[4])
+        self.draw.chord((ints_02[0], ints_02[3], ints_02[1], ints_02[5]),
+                        180, 360, fill=self.gold_tones[4])
+        self.draw.chord((ints_02[4], ints_02[0], ints_02[2], ints_02[1]),
+                        270, 90, fill=self.gold_tones[4])
+
+        # The three smaller bowls.
+        ints_03 = []
+        ints_03a_list = [15, 40]
+        ints_03b_list = [44, 70]
+        for i in ints_03a_list:
+            ints_03.append(self.image_center - i)
+            ints_03.append(self.image_center + i)
+        for i in ints_03b_list:
+            ints_03.append(self.platform_int - i)
+            ints_03.append(self.image_side - self.platform_int + i)
+        for i in range(3):
+            self.draw.chord((ints_03[2], ints_03[6], ints_03[0], ints_03[4]),
+                            360, 180, fill=self.gold_tones[6])
+            self.draw.chord((ints_03[5], ints_03[2], ints_03[7], ints_03[0]),
+                            90, 270, fill=self.gold_tones[6])
+            self.draw.chord((ints_03[1], ints_03[5], ints_03[3], ints_03[7]),
+                            180, 360, fill=self.gold_tones[6])
+            self.draw.chord((ints_03[6], ints_03[1], ints_03[4], ints_03[3]),
+                            270, 90, fill=self.gold_tones[6])
+            ints_03[0] += 27
+            ints_03[1] -= 27
+            ints_03[2] += 27
+            ints_03[3] -= 27
+
+        # The upper platform.
+        ints_04_list = [58, 65]
+        ints_04 = [self.image_center - 45, self.image_center + 45]
+        for i in ints_04_list:
+            ints_04.append(self.platform_int - i)
+            ints_04.append(self.image_side - self.platform_int + i)
+        self.draw.rectangle((ints_04[0], ints_04[4], ints_04[1], ints_04[2]),
+                            fill=self.gold_tones[0])
+        self.draw.rectangle((ints_04[3], ints_04[0], ints_04[5], ints_04[1]),
+                            fill=self.gold_tones[0])
+        self.draw.rectangle((ints_04[0], ints_04[3], ints_04[1], ints_04[5]),
+                            fill=self.gold_tones[0])
+        self.draw.rectangle((ints_04[4], ints_04[0], ints_04[2], ints_04[1]),
+                            fill=self.gold_tones[0])
+
+        # Shading for the upper platform.
+        line_growth = 1
+        ints_05_list = [46, 58, 65]
+        ints_05 = [self.image_center - ints_05_list[0], self.image_center + ints_05_list[0],
+                   self.platform_int - ints_05_list[1], self.platform_int - ints_05_list[2],
+                   self.image_side - self.platform_int + ints_05_list[1],
+                   self.image_side - self.platform_int + ints_05_list[2]]
+        for color in reversed(self.gold_tones[1:15]):
+            self.draw.line((ints_05[0] + line_growth, ints_05[3], ints_05[0] + line_growth, ints_05[2]),
+                        fill=color)
+            self.draw.line((ints_05[4], ints_05[0] + line_growth, ints_05[5], ints_05[0] + line_growth),
+                        fill=color)
+            self.draw.line((ints_05[1] - line_growth, ints_05[4], ints_05[1] - line_growth, ints_05[5]),
+                        fill=color)
+            self.draw.line((ints_05[3], ints_05[1] - line_growth, ints_05[2], ints_05[1] - line_growth),
+                        fill=color)
+            line_growth *= 1.4
+
+        # The hovering circle.
+        ints_06_list = [70, 110]
+        ints_06 = [self.image_center - 20, self.image_center + 20]
+        for i in ints_06_list:
+            ints_06.append(self.platform_int - i)
+            ints_06.append(self.image_side - self.platform_int + i)
+        self.draw.ellipse((ints_06[0], ints_06[4], ints_06[1], ints_06[2]),
+                          fill=self.gold_tones[14])
+        self.draw.ellipse((ints_06[3], ints_06[0], ints_06[5], ints_06[1]),
+                          fill=self.gold_tones[14])
+        self.draw.ellipse((ints_06[0], ints_06[3], ints_06[1], ints_06[5]),
+                          fill=self.gold_tones[14])
+        self.draw.ellipse((ints_06[4], ints_06[0], ints_06[2], ints_06[1]),
+                          fill=self.gold_tones[14])
+
+    def draw_box_arcs(self):
+        """A method to fill the boxes with a repeating arc pattern."""
+
+        fill = [self.green_tones[2], self.green_tones[8]]
+
+        ints_07 = []
+        for i in [2, 4]:
+            ints_07.append(self.image_center - self.shape_ints[i])
+            ints_07.append(self.image_center + self.shape_ints[i])
+        ints_07.append((self.shape_ints[4] - self.shape_ints[2]) / 1.5)
+        ints_07.append((self.shape_ints[4] - self.shape_ints[2]) / 3)
+        
+        arc_step = int((self.shape_ints[4] * 2) / 45) * self.detail_step
+        for i in range(0, int(self.shape_ints[4] * 2) - 25, arc_step):
+            # Outer pattern above the shape.
+            self.draw.arc((ints_07[2] + i,
+                           ints_07[2],
+                           self.image_center - (
+                                       self.shape_ints[4] - ints_07[4]) + i,
+                           self.image_center - (
+                                       self.shape_ints[4] - ints_07[4])),
+                          180, 360, fill=fill[0], width=2)
+            # Outer pattern to the right of the shape.
+            self.draw.arc((ints_07[3] - ints_07[4],
+                           ints_07[2] + i,
+                           ints_07[3],
+                           ints_07[2] + ints_07[4] + i),
+                          270, 90, fill=fill[0], width=2)
+            # Outer pattern below the shape.
+            self.draw.arc((ints_07[3] - ints_07[4] - i,
+                           ints_07[3] - ints_07[4],
+                           ints_07[3] - i,
+                           ints_07[3]),
+                360, 180, fill=fill[0], width=2)
+            # Outer pattern to the left of the shape.
+            self.draw.arc((ints_07[2],
+                           ints_07[3] - ints_07[4] - i,
+                           ints_07[2] + ints_07[4],
+                           ints_07[3] - i),
+                          90, 270, fill=fill[0], width=2)
+
+        for i in range(0, int((self.shape_ints[4] - ints_07[4]) * 2 - 35), arc_step):
+            # Inner pattern above the shape.
+            self.draw.arc((ints_07[0] - ints_07[5] + i,
+                           ints_07[0] - ints_07[4],
+                           ints_07[0] + ints_07[5] + i,
+                           ints_07[0]),
+                          360, 180, fill=fill[1], width=3)
+            # Inner pattern to the right of the shape.
+            self.draw.arc((ints_07[1],
+                           ints_07[0] - ints_07[5] + i,
+                           ints_07[1] + ints_07[4],
+                           ints_07[0] + ints_07[5] + i),
+                          90, 270, fill=fill[1], width=3)
+            # Inner pattern below the shape.
+            self.draw.arc((ints_07[1] - ints_07[5] - i,
+                           ints_07[1],
+                           ints_07[1] + ints_07[5] - i,
+                           ints_07[1] + ints_07[4]),
+                          180, 360, fill=fill[1], width=3)
+            # Inner pattern to the left of the shape.
+            self.draw.arc((ints_07[0] - ints_07[4],
+                           ints_07[1] - ints_07[5] - i,
+                           ints_07[0],
+                           ints_07[1] + ints_07[5] - i),
+                          270, 90, fill=fill[1], width=3)
+
+    def draw_inner_square_pattern(self):
+        """A method to draw the pattern in the innermost square."""
+
+        ints_08 = []
+        for i in [0, 2]:
+            ints_08.append(self.image_center - self.shape_ints[i])
+            ints_08.append(self.image_center + self.shape_ints[i])
+
+        for i in range(0, int((self.image_center - self.shape_ints[2]) / 2),
+                       (10 + self.inner_square_pattern_stretch) * self.detail_step):
+            # Pattern above the shape.
+            self.draw.polygon(((ints_08[2] + i, ints_08[2]),
+                               (ints_08[0] + i, ints_08[0]),
+                               (ints_08[0] + i, ints_08[2])),
+                              outline=self.circle_colors[5])
+            self.draw.polygon(((ints_08[3] - i, ints_08[2]),
+                               (ints_08[1] - i, ints_08[0]),
+                               (ints_08[1] - i, ints_08[2])),
+                              outline=self.circle_colors[5])
+            # Pattern to the right of the shape.
+            self.draw.polygon(((ints_08[3], ints_08[2] + i),
+                               (ints_08[1], ints_08[0] + i),
+                               (ints_08[3], ints_08[0] + i)),
+                              outline=self.circle_colors[5])
+            self.draw.polygon(((ints_08[3], ints_08[3] - i),
+                               (ints_08[1], ints_08[1] - i),
+                               (ints_08[3], ints_08[1] - i)),
+                              outline=self.circle_colors[5])
+            # Pattern below the shape.
+            self.draw.polygon(((ints_08[3] - i, ints_08[3]),
+                               (ints_08[1] - i, ints_08[1]),
+                               (ints_08[1] - i, ints_08[3])),
+                              outline=self.circle_colors[5])
+            self.draw.polygon(((ints_08[2] + i, ints_08[3]),
+                               (ints_08[0] + i, ints_08[1]),
+                               (ints_08[0] + i, ints_08[3])),
+                              outline=self.circle_colors[5])
+            # Pattern to the left of the shape.
+            self.draw.polygon(((ints_08[2], ints_08[3] - i),
+                               (ints_08[0], ints_08[1] - i),
+                               (ints_08[2], ints_08[1] - i)),
+                              outline=self.circle_colors[5])
+            self.draw.polygon(((ints_08[2], ints_08[2] + i),
+                               (ints_08[0], ints_08[0] + i),
+                               (ints_08[2], ints_08[0] + i)),
+                              outline=self.circle_colors[5])
+
+    def change_border_circle_halo_position(self):
+        """A method to change the direction of the border circle halos."""
+
+        self.halo_spin_clockwise += 4
+        self.halo_spin_counterclockwise -= 4
+
+    def change_circle_hue_count(self):
+        """A method to change the circle hues between frames of the GIF."""
+
+        self.circle_hue_count += self.circle_hue_count_growth
+        if self.circle_hue_count == 25:
+            self.change_circle_hue_count_direction()
+        elif self.circle_hue_count == 10:
+            self.change_circle_hue_count_direction()
+
+    def change_circle_hue_count_direction(self):
+        """A method to change the direction of the circle hue count."""
+
+        self.circle_hue_count_growth = self.circle_hue_count_growth * -1
+
+    def change_circle_line_width(self):
+        """When creating a GIF, makes the circle line width shrink and grow."""
+
+        self.circle_line_width += self.circle_line_width_growth
+        if self.circle_line_width == 6:
+            self.change_circle_line_width_direction()
+        elif self.circle_line_width == 1:
+            self.change_circle_line_width_direction()
+
+    def change_circle_line_width_direction(self):
+        """A method to change the direction of the circle line width."""
+
+        self.circle_line_width_growth = self.circle_line_width_growth * -1
+
+    def change_spoke_position(self):
+        """A method to make the circle spokes spin."""
+
+        self.spoke_spin_clockwise += 1
+        self.spoke_spin_counterclockwise -= 1
+
+    def change_inner_square_pattern_stretch(self):
+        """When creating a GIF, makes the inner square pattern shrink and grow."""
+
+        self.inner_square_pattern_stretch += self.inner_square_pattern_growth
+        if self.inner_square_pattern_stretch == 20:
+            self.change_inner_square_pattern_direction()
+        elif self.inner_square_pattern_stretch == 5:
+            self.change_inner_square_pattern_direction()
+
+    def change_inner_square_pattern_direction(self):
+        """A method to change the direction of the inner square pattern growth."""
+
+        self.inner_square_pattern_growth = self.inner_square_pattern_growth * -1
+
+    def change_posterize_bits(self):
+        """A method to change posterization bits."""
+
+        if 18 > self.current_frame >= 10:
+            self.posterize_bits -= 1
+        elif 26 > self.current_frame >= 18:
+            self.posterize_bits += 1
+        elif self.current_frame >= 26:
+            pass
+
+    def apply_image_effects(self):
+        """Apply image sharpening and posterization effects."""
+
+        image = self.image
+        if self.supersample > 1:
+            # Shrink the supersampled frame back down, averaging away the jagged edges.
+            image = image.reduce(self.supersample)
+        if self.unsharp_mask:
+            image = self.apply_unsharp_mask(image)
+        self.image_mask = image
+        self.image_effects = ImageOps.posterize(self.image_mask, bits=self.posterize_bits)
+
+    def apply_unsharp_mask(self, image):
+        """A method to sharpen the image, filtering only what changed since the last frame when that is quicker."""
+
+        radius = self.unsharp_mask_radius * self.image_scale
+        unsharp_mask = ImageFilter.UnsharpMask(radius=radius, percent=75)
+        support = get_blur_support(radius)
+        area_limit = image.size[0] * image.size[1] * self.dirty_area_limit
+        previous_effects = self.previous_effects
+
+        image_mask = None
+        self.effects_boxes = None
+        if self.dirty_effects and previous_effects is not None and previous_effects[0] == self.region \
+                and previous_effects[1].size == image.size \
+                and get_box_area(self.get_animated_boxes(image.size, support)) <= area_limit:
+            changed_boxes = get_changed_boxes(previous_effects[1], image, self.effects_tile_size, support)
+            if get_box_area(grow_box(box, support, image.size) for box in changed_boxes) <= area_limit:
+                image_mask = apply_filter_to_boxes(image, previous_effects[2], changed_boxes, unsharp_mask, support)
+                self.effects_boxes = changed_boxes
+        if image_mask is None and self.layer_pool is not None:
+            image_mask = self.layer_pool.filter_in_bands(image, unsharp_mask, support)
+        elif image_mask is None:
+            image_mask = image.filter(unsharp_mask)
+
+        if self.dirty_effects:
+            self.previous_effects = (self.region, image.copy(), image_mask)
+        return image_mask
+
+    def get_animated_boxes(self, size, support):
+        """A method to return boxes around the layers that move between frames, grown by the blur support.
+
+        The boxes are in the pixels of the image being filtered, which may be a scaled region of the full image.
+        """
+
+        edge = self.circle_to_image_edge
+        side = self.image_side
+        # The halos reach past the border circles by their largest ring and line width.
+        near, far = edge / 2 - 30, edge * 2.5 + 30
+        # The circle box holds the circle, spokes and inner square pattern, and the heart is the largest arc.
+        boxes = [(edge, edge, side - edge, side - edge),
+                 (self.image_center - 245, self.image_center - 245, self.image_center + 245, self.image_center + 245),
+                 (near, near, far, far), (side - far, near, side - near, far),
+                 (side - far, side - far, side - near, side - near), (near, side - far, far, side - near)]
+
+        origin_x, origin_y = self.region[0][:2] if self.region else (0, 0)
+        scale = self.image_scale
+        return [grow_box((int((left - origin_x) * scale), int((top - origin_y) * scale),
+                          int((right - origin_x) * scale) + 1, int((bottom - origin_y) * scale) + 1), support, size)
+                for left, top, right, bottom in boxes]
+
+    def change_current_frame(self):
+        """Progresses to the next GIF frame."""
+
+        self.current_frame += 1
+
+    def reset_settings(self):
+        """A method to reset settings in the __init__ method."""
+
+        self.background_pattern_count = self.settings_list[0]
+        self.border_circle_divisor = self.settings_list[1]
+        self.circle_shrink = self.settings_list[2]
+        self.circle_line_distance = self.settings_list[3]
+
+    def save_image(self):
+        """Save the image with its effects to the output folder, or keep it in memory."""
+
+        if self.output_dir is None:
+            self.frames.append(self.image_effects)
+        else:
+            save_atomically(get_frame_path(self.output_dir, self.current_frame),
+                            lambda file: self.image_effects.save(file, format='PNG'))
+
+        print(f"Creating frame {self.current_frame} of {self.frame_count}...")
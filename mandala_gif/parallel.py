@@ -0,0 +1,111 @@
+# parallel.py - Draws the layers of a single frame, and its image effects, on several CPUs at once.
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from PIL import Image, ImageDraw
+
+from .draw import RegionDraw
+from .effects import grow_box
+from .mandala import Mandala
+from .scheduler import get_worker_renderer
+
+
+def draw_layer_group(settings, preset, frame, region, size, layer_names):
+    """Draws some of a frame's layers onto a transparent image in a worker process.
+
+    Returns the box of the image that was drawn on, that part of the image, and how long each layer took.
+    """
+
+    # The worker keeps the mandala it drew last, so following frames carry on from it instead of seeking.
+    mandala = get_worker_renderer(settings, preset).get_mandala(frame)
+    image = Image.new('RGBA', size, (0, 0, 0, 0))
+    mandala.draw = ImageDraw.Draw(image) if region is None else RegionDraw(image, *region)
+    mandala.get_circle_colors()
+    layer_seconds = []
+    for layer_name in layer_names:
+        start_time = time.perf_counter()
+        getattr(mandala, layer_name)()
+        layer_seconds.append(time.perf_counter() - start_time)
+
+    mandala.finish_layers()
+    mandala.advance_frame()
+
+    box = image.getbbox()
+    return box, image.crop(box) if box else None, layer_seconds
+
+
+class LayerPool:
+    """A class to draw groups of layers on worker processes and filter bands of the frame on threads.
+
+    ImageDraw holds the GIL while it draws, so the layers are drawn in processes, each onto its own
+    transparent image. ImageDraw does not smooth edges, so every pixel drawn is fully opaque, and pasting
+    the images back in z-order gives exactly the frame drawn one layer at a time. Pillow's filters release
+    the GIL, so the unsharp mask is split into bands on threads.
+    """
+
+    def __init__(self, workers=None):
+        """A method to start the worker processes and threads."""
+
+        self.workers = workers or os.cpu_count() or 1
+        self.process_executor = ProcessPoolExecutor(self.workers)
+        self.thread_executor = ThreadPoolExecutor(self.workers)
+
+        # How long each layer took to draw last time, used to split the layers into even groups.
+        # The background is left out, since it is pasted from the layer cache before the groups are drawn.
+        self.layer_seconds = {layer_name: 1 for layer_name in Mandala.layer_names if layer_name != 'draw_background'}
+
+    def get_layer_groups(self):
+        """A method to split the layers into runs, in z-order, that take about as long as each other to draw."""
+
+        target_seconds = sum(self.layer_seconds.values()) / self.workers
+        groups = [[]]
+        group_seconds = 0
+        for layer_name, seconds in self.layer_seconds.items():
+            if groups[-1] and group_seconds + seconds / 2 > target_seconds and len(groups) < self.workers:
+                groups.append([])
+                group_seconds = 0
+            groups[-1].append(layer_name)
+            group_seconds += seconds
+        return groups
+
+    def draw_layers(self, mandala):
+        """A method to draw every layer of the mandala's current frame onto its image."""
+
+        mandala.get_circle_colors()
+        mandala.draw_background()
+
+        groups = self.get_layer_groups()
+        pending_groups = [self.process_executor.submit(draw_layer_group, mandala.settings, mandala.preset,
+                                                       mandala.current_frame, mandala.region, mandala.image.size,
+                                                       group)
+                          for group in groups]
+        for group, pending_group in zip(groups, pending_groups):
+            box, layer, layer_seconds = pending_group.result()
+            if box is not None:
+                mandala.image.paste(layer, box[:2], layer)
+            self.layer_seconds.update(zip(group, layer_seconds))
+
+    def filter_in_bands(self, image, image_filter, support):
+        """Returns the filtered image, filtering horizontal bands of it on the threads."""
+
+        width, height = image.size
+        band_height = -(-height // self.workers)
+        boxes = [(0, top, width, min(height, top + band_height)) for top in range(0, height, band_height)]
+
+        def filter_band(box):
+            padded_box = grow_box(box, support, image.size)
+            filtered = image.crop(padded_box).filter(image_filter)
+            return filtered.crop((0, box[1] - padded_box[1], width, box[3] - padded_box[1]))
+
+        output = Image.new(image.mode, image.size)
+        for box, band in zip(boxes, self.thread_executor.map(filter_band, boxes)):
+            output.paste(band, box[:2])
+        return output
+
+    def shutdown(self):
+        """A method to stop the worker processes and threads."""
+
+        self.process_executor.shutdown()
+        self.thread_executor.shutdown()
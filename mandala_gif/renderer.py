@@ -0,0 +1,64 @@
+# renderer.py - Renders frames and animations in-process, for programs that use Mandala-GIF as a library.
+
+from io import BytesIO
+
+from .files import GifCreator
+from .mandala import Mandala
+
+
+class Renderer:
+    """A class to render frames, regions and whole animations in memory, keeping caches between calls."""
+
+    def __init__(self, settings=None, layer_cache=None, preset='standard', layer_pool=None):
+        """A method to check the settings and prepare the first frame, drawn with the given quality preset.
+
+        A LayerPool, when given, draws the layers of each frame on several CPUs to lower the time to one frame.
+        """
+
+        self.settings = dict(settings or {})
+        self.preset = preset
+
+        if layer_cache is None:
+            layer_cache = {}
+        self.layer_cache = layer_cache
+        self.layer_pool = layer_pool
+
+        self.mandala = Mandala(self.settings, layer_cache=self.layer_cache, preset=self.preset,
+                               layer_pool=self.layer_pool)
+        self.frame_count = self.mandala.frame_count
+
+    def get_mandala(self, frame):
+        """A method to return a mandala that can draw the given frame next."""
+
+        if self.mandala.current_frame > frame:
+            # Frames only move forward, so start again for an earlier frame.
+            self.mandala = Mandala(self.settings, layer_cache=self.layer_cache, preset=self.preset,
+                                   layer_pool=self.layer_pool)
+        self.mandala.seek_frame(frame)
+        return self.mandala
+
+    def render_frame(self, frame):
+        """Returns the given frame, with its image effects, as a Pillow image."""
+
+        mandala = self.get_mandala(frame)
+        mandala.draw_frame()
+        mandala.advance_frame()
+        return mandala.image_effects
+
+    def render_region(self, frame, box, scale=1):
+        """Returns only the part of the given frame inside a box, scaled by the given amount."""
+
+        return self.get_mandala(frame).render_region(frame, box, scale)
+
+    def render_frames(self):
+        """Yields every frame of the animation in turn."""
+
+        for frame in range(1, self.frame_count + 1):
+            yield self.render_frame(frame)
+
+    def render_animation(self, encoder='gif', **encoder_options):
+        """Returns the whole animation as the bytes of a GIF file, or of a WebP or APNG file when chosen."""
+
+        buffer = BytesIO()
+        GifCreator(create_gif=False, encoder=encoder, **encoder_options).write_gif(buffer, self.render_frames())
+        return buffer.getvalue()
@@ -0,0 +1,194 @@
+# scheduler.py - Renders frames on worker processes without going over a memory budget.
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .files import get_frame_path, save_atomically
+from .renderer import Renderer
+
+
+# Each worker process keeps its layers between tasks, so a background is only drawn once per worker for every
+# background_pattern_count it sees. It also keeps the renderer of the variant it drew last, so consecutive frames
+# carry on from each other instead of seeking from the first frame.
+worker_layer_cache = {}
+worker_renderer = {}
+
+
+def get_peak_memory():
+    """Returns the most memory this process has used so far, in bytes, or None where it cannot be measured."""
+
+    try:
+        import resource
+    except ImportError:
+        # Windows has no resource module.
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def format_memory(size):
+    """Returns a number of bytes in megabytes or gigabytes."""
+
+    if size >= 2 ** 30:
+        return f"{size / 2 ** 30:.1f} GB"
+    return f"{size / 2 ** 20:.0f} MB"
+
+
+def parse_memory(text):
+    """Turns a memory size like 512M or 4G into a number of bytes."""
+
+    units = {'K': 2 ** 10, 'M': 2 ** 20, 'G': 2 ** 30}
+    text = text.strip().upper().rstrip('B')
+    if text[-1:] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def get_worker_renderer(settings, preset):
+    """Returns this worker process's renderer for a variant, starting a new one when the variant changes."""
+
+    variant_key = (json.dumps(settings, sort_keys=True), preset)
+    renderer = worker_renderer.get(variant_key)
+    if renderer is None:
+        worker_renderer.clear()
+        renderer = worker_renderer[variant_key] = Renderer(settings, worker_layer_cache, preset)
+    return renderer
+
+
+def render_worker_frame(settings, preset, frame, output_dir=None):
+    """Draws one frame in a worker process, saving it to the output folder or returning it."""
+
+    image = get_worker_renderer(settings, preset).render_frame(frame)
+
+    if output_dir is None:
+        return image
+    save_atomically(get_frame_path(output_dir, frame), lambda file: image.save(file, format='PNG'))
+
+
+def run_task(function, args):
+    """Runs a task in a worker process, returning its result with the worker's process id and peak memory."""
+
+    return function(*args), os.getpid(), get_peak_memory()
+
+
+def create_frames(mandala, scheduler, checkpoint=None):
+    """Draws and saves every frame from the mandala's current frame on, like Mandala.create_frames does, on workers."""
+
+    frames = range(mandala.current_frame, mandala.frame_count + 1)
+    tasks = [(mandala.settings, mandala.preset, frame, mandala.output_dir) for frame in frames]
+    for image, frame in zip(scheduler.map(render_worker_frame, tasks), frames):
+        if mandala.output_dir is None:
+            mandala.frames.append(image)
+        elif checkpoint is not None:
+            checkpoint.add_frame(frame)
+        print(f"Creating frame {frame} of {mandala.frame_count}...")
+    mandala.current_frame = mandala.gif_frames
+
+    print(scheduler.format_report())
+
+
+class MemoryScheduler:
+    """A class to run tasks on worker processes, running only as many at once as fit in a memory budget."""
+
+    # How many tasks a lone worker runs to measure its memory, since a worker keeps the last frame it drew
+    # and so peaks higher on its second frame than its first.
+    calibration_tasks = 2
+
+    # Room left for workers growing past the peak memory they have reported so far.
+    memory_headroom = 1.1
+
+    def __init__(self, max_memory=None, max_workers=None, worker_memory=None):
+        """A method to control the memory budget in bytes, and the most workers to use.
+
+        worker_memory is a first guess at the peak memory of one worker, such as from the CostModel, used to
+        refuse a budget that is too small before any worker starts. The first tasks are run on a lone worker
+        to measure its real peak, then the number of workers is adjusted to the peak memory each worker
+        reports as its tasks finish.
+        """
+
+        if max_memory is not None and get_peak_memory() is None:
+            raise ValueError("A memory budget needs the resource module to measure memory, "
+                             "which this platform does not have")
+        self.max_memory = max_memory
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.worker_memory = worker_memory
+
+        # The peak memory reported by each worker process, and the results of the last run.
+        self.worker_peaks = {}
+        self.task_count = 0
+        self.seconds = 0
+        self.peak_memory = 0
+
+    def get_worker_limit(self):
+        """A method to work out how many workers fit in the memory left over by this process."""
+
+        if self.max_memory is None:
+            return self.max_workers
+        worker_memory = max(self.worker_peaks.values(), default=self.worker_memory)
+        if worker_memory is None:
+            return 1
+        worker_memory *= self.memory_headroom
+
+        available_memory = self.max_memory - get_peak_memory()
+        worker_limit = min(self.max_workers, int(available_memory // worker_memory))
+        if worker_limit < 1:
+            raise ValueError(f"A memory budget of {format_memory(self.max_memory)} is too small: this process uses "
+                             f"{format_memory(get_peak_memory())} and each worker "
+                             f"{format_memory(worker_memory)}")
+        if self.task_count < self.calibration_tasks:
+            return 1
+        return worker_limit
+
+    def map(self, function, tasks):
+        """A method to run function(*args) for each task's args on the workers, yielding the results in order."""
+
+        start_time = time.perf_counter()
+        worker_limit = self.get_worker_limit()
+        executor = ProcessPoolExecutor(worker_limit)
+        pool_peaks = {}
+        pending_tasks = []
+        try:
+            for args in tasks:
+                while len(pending_tasks) >= worker_limit:
+                    yield self.finish_task(pending_tasks.pop(0), pool_peaks)
+
+                    new_worker_limit = self.get_worker_limit()
+                    if new_worker_limit != worker_limit:
+                        # Idle workers keep the memory they have used, so finish the running tasks
+                        # and start a new pool of the right size rather than leaving workers idle.
+                        for pending_task in pending_tasks:
+                            yield self.finish_task(pending_task, pool_peaks)
+                        pending_tasks = []
+                        executor.shutdown()
+                        executor = ProcessPoolExecutor(new_worker_limit)
+                        pool_peaks = {}
+                        worker_limit = new_worker_limit
+
+                pending_tasks.append(executor.submit(run_task, function, args))
+
+            for pending_task in pending_tasks:
+                yield self.finish_task(pending_task, pool_peaks)
+        finally:
+            executor.shutdown(cancel_futures=True)
+            self.seconds += time.perf_counter() - start_time
+
+    def finish_task(self, pending_task, pool_peaks):
+        """A method to wait for a task, keeping track of the memory used by its worker."""
+
+        result, process_id, peak_memory = pending_task.result()
+        self.task_count += 1
+        if peak_memory is not None:
+            self.worker_peaks[process_id] = peak_memory
+            pool_peaks[process_id] = peak_memory
+            self.peak_memory = max(self.peak_memory, get_peak_memory() + sum(pool_peaks.values()))
+        return result
+
+    def format_report(self):
+        """A method to describe the throughput and peak memory of the tasks run so far."""
+
+        throughput = self.task_count / self.seconds if self.seconds else 0
+        report = f"Rendered {self.task_count} frames in {self.seconds:.1f} seconds ({throughput:.2f} frames a second)"
+        if not self.peak_memory:
+            return report
+        return f"{report}, using at most {format_memory(self.peak_memory)} of memory"
@@ -0,0 +1,150 @@
+# service.py - A local HTTP service that renders jobs while keeping its caches warm.
+
+import json
+import threading
+import traceback
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+from .renderer import Renderer
+
+
+class RenderService:
+    """A class to render jobs sent over a local HTTP API, keeping caches warm between jobs."""
+
+    # The content type sent back for each animation format.
+    content_types = {'gif': 'image/gif', 'webp': 'image/webp', 'apng': 'image/apng',
+                     'raw': 'application/octet-stream', 'y4m': 'video/x-yuv4mpeg', 'npy': 'application/octet-stream'}
+
+    def __init__(self, host='127.0.0.1', port=8765, layer_pool=None):
+        """A method to control settings for the service and warm up its caches.
+
+        A LayerPool, when given, draws the layers of each job's frames on several CPUs to answer sooner.
+        """
+
+        self.host = host
+        self.port = port
+        self.layer_pool = layer_pool
+
+        # Layers shared by every job, and the jobs currently being rendered.
+        self.layer_cache = {}
+        self.pending_jobs = {}
+        self.pending_lock = threading.Lock()
+
+        self.warm_up()
+
+        self.server = ThreadingHTTPServer((self.host, self.port), RenderRequestHandler)
+        self.server.render_service = self
+
+    def warm_up(self):
+        """A method to render a first frame so the caches and image encoders are ready."""
+
+        self.render_job({'frame': 1})
+
+    def serve(self):
+        """A method to handle render jobs until the service is interrupted."""
+
+        print(f"Rendering jobs at http://{self.host}:{self.server.server_port}/render")
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server.server_close()
+
+    def run_job(self, job):
+        """A method to render a job, sharing the result between identical jobs sent at the same time."""
+
+        job_key = json.dumps(job, sort_keys=True)
+
+        with self.pending_lock:
+            pending_job = self.pending_jobs.get(job_key)
+            if pending_job is None:
+                pending_job = self.pending_jobs[job_key] = Future()
+                renders_job = True
+            else:
+                renders_job = False
+
+        if renders_job:
+            try:
+                pending_job.set_result(self.render_job(job))
+            except Exception as error:
+                pending_job.set_exception(error)
+            finally:
+                with self.pending_lock:
+                    del self.pending_jobs[job_key]
+
+        return pending_job.result()
+
+    def render_job(self, job):
+        """A method to render a single PNG frame or region of it, or the whole animation when no frame is given."""
+
+        if not isinstance(job, dict):
+            raise ValueError("A render job must be a JSON object")
+        unknown_keys = set(job) - {'settings', 'preset', 'frame', 'region', 'scale', 'format'}
+        if unknown_keys:
+            raise ValueError(f"Unknown job keys: {', '.join(sorted(unknown_keys))}")
+        settings = job.get('settings', {})
+        if not isinstance(settings, dict):
+            raise ValueError("The job settings must be a JSON object of setting names and numbers")
+        if not isinstance(job.get('preset', 'standard'), str):
+            raise ValueError("The job preset must be a string")
+
+        renderer = Renderer(job.get('settings'), self.layer_cache, job.get('preset', 'standard'), self.layer_pool)
+        buffer = BytesIO()
+
+        if 'frame' in job:
+            if 'format' in job:
+                raise ValueError("A format can only be chosen for the whole animation")
+            if not isinstance(job['frame'], int):
+                raise ValueError("The job frame must be a whole number")
+            if 'region' in job:
+                region = job['region']
+                scale = job.get('scale', 1)
+                if not isinstance(region, list) or len(region) != 4 \
+                        or not all(isinstance(side, int) for side in region):
+                    raise ValueError("The job region must be a list of four whole numbers")
+                if not isinstance(scale, (int, float)):
+                    raise ValueError("The job scale must be a number")
+                image = renderer.render_region(job['frame'], region, scale)
+            else:
+                image = renderer.render_frame(job['frame'])
+            image.save(buffer, format='PNG')
+            return 'image/png', buffer.getvalue()
+
+        if 'region' in job or 'scale' in job:
+            raise ValueError("A region can only be rendered for a single frame")
+
+        encoder = job.get('format', 'gif')
+        animation = renderer.render_animation(encoder)
+        return self.content_types[encoder], animation
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """A class to pass render job requests on to the render service."""
+
+    def do_POST(self):
+        """A method to render the JSON job in the request body."""
+
+        if self.path != '/render':
+            self.send_error(404)
+            return
+
+        try:
+            job = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            content_type, body = self.server.render_service.run_job(job)
+        except ValueError as error:
+            self.send_error(400, str(error))
+            return
+        except Exception:
+            # Any other error is a bug, but the client still gets a reply rather than a dropped connection.
+            traceback.print_exc()
+            self.send_error(500, "The render job failed")
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
@@ -0,0 +1,83 @@
+# sweep.py - Renders many variants of the mandala on one pool of worker processes.
+
+import itertools
+import json
+from pathlib import Path
+
+from .encoders import encoders
+from .estimate import CostModel
+from .files import GifCreator
+from .mandala import Mandala
+from .scheduler import MemoryScheduler, render_worker_frame
+
+
+def get_grid_variants(grid, base_settings=None):
+    """Returns the settings for every combination of the values in a grid of setting names and value lists."""
+
+    names = list(grid)
+    return [dict(base_settings or {}, **dict(zip(names, values)))
+            for values in itertools.product(*(grid[name] for name in names))]
+
+
+class Sweep:
+    """A class to render many variants of the animation on one worker pool, sharing cached layers between them."""
+
+    def __init__(self, variants, output_dir='Mandala-sweep', preset='standard', encoder='gif', workers=None,
+                 max_memory=None, **encoder_options):
+        """A method to check every variant's settings and control where the animations are written.
+
+        Workers render the frames, as many at once as fit in max_memory bytes when it is given.
+        """
+
+        self.variants = [dict(settings) for settings in variants]
+        if not self.variants:
+            raise ValueError("A sweep needs at least one variant")
+        mandalas = [Mandala(settings, preset=preset, canvas=False) for settings in self.variants]
+        self.frame_counts = [mandala.frame_count for mandala in mandalas]
+
+        self.output_dir = Path(output_dir)
+        self.preset = preset
+        self.encoder = encoder
+        self.encoder_options = dict(encoder_options, workers=workers)
+        # The largest predicted worker lets a budget that is too small be refused before any worker starts.
+        cost_model = CostModel()
+        self.scheduler = MemoryScheduler(max_memory, workers,
+                                         max(cost_model.get_worker_memory(mandala) for mandala in mandalas))
+        self.scheduler.get_worker_limit()
+
+    def get_output_path(self, index):
+        """A method to name the animation of a variant by its place in the sweep."""
+
+        return self.output_dir / f'Mandala-{index + 1:03d}{encoders[self.encoder].extension}'
+
+    def run(self):
+        """A method to render every frame of every variant, writing each animation as soon as its frames are done."""
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tasks = [(index, frame) for index, frame_count in enumerate(self.frame_counts)
+                 for frame in range(1, frame_count + 1)]
+        variant_frames = [[] for settings in self.variants]
+
+        frames = self.scheduler.map(render_worker_frame, [(self.variants[index], self.preset, frame)
+                                                           for index, frame in tasks])
+        for image, (index, frame) in zip(frames, tasks):
+            self.finish_frame(variant_frames, index, image)
+        print(self.scheduler.format_report())
+
+        index_path = self.output_dir / 'sweep.json'
+        index_path.write_text(json.dumps([{'file': self.get_output_path(index).name, 'settings': settings}
+                                          for index, settings in enumerate(self.variants)], indent=2))
+        return index_path
+
+    def finish_frame(self, variant_frames, index, image):
+        """A method to collect a finished frame, writing its variant's animation once every frame is in."""
+
+        frames = variant_frames[index]
+        frames.append(image)
+        if len(frames) < self.frame_counts[index]:
+            return
+
+        gif = GifCreator(create_gif=False, encoder=self.encoder, **self.encoder_options)
+        gif.write_gif(self.get_output_path(index), frames)
+        variant_frames[index] = None
+        print(f"Rendered variant {index + 1} of {len(self.variants)}: {self.get_output_path(index)}")
@@ -0,0 +1,108 @@
+import json
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageChops, ImageSequence
+
+from mandala_gif import Checkpoint, GifCreator, Mandala
+from mandala_gif.files import get_frame_path, get_frame_paths
+
+settings = {'image_side': 400, 'frame_count': 5}
+
+
+class InterruptingCheckpoint(Checkpoint):
+    """A checkpoint that stops the render, as Ctrl+C would, once a number of frames are finished."""
+
+    def __init__(self, folder_path, settings, stop_after):
+        super().__init__(folder_path, settings)
+        self.stop_after = stop_after
+
+    def add_frame(self, frame):
+        super().add_frame(frame)
+        if len(self.finished_frames) == self.stop_after:
+            raise KeyboardInterrupt
+
+
+def render(folder_path, checkpoint, resume=False):
+    """Renders into a folder the way the command line does with --workdir, returning the first frame drawn."""
+
+    mandala = Mandala(settings, output_dir=folder_path)
+    first_frame = checkpoint.load(resume)
+    if first_frame <= mandala.frame_count:
+        mandala.seek_frame(first_frame)
+        mandala.create_frames(checkpoint)
+    return first_frame
+
+
+def test_resumed_render_matches_an_uninterrupted_one(tmp_path):
+    whole_dir, resumed_dir = tmp_path / 'whole', tmp_path / 'resumed'
+    whole_dir.mkdir()
+    resumed_dir.mkdir()
+    render(whole_dir, Checkpoint(whole_dir, settings))
+
+    with pytest.raises(KeyboardInterrupt):
+        render(resumed_dir, InterruptingCheckpoint(resumed_dir, settings, stop_after=2))
+    assert (resumed_dir / Checkpoint.file_name).exists()
+    assert sorted(path.name for path in resumed_dir.glob('Mandala-[0-9]*.png')) == ['Mandala-01.png',
+                                                                                   'Mandala-02.png']
+
+    assert render(resumed_dir, Checkpoint(resumed_dir, settings), resume=True) == 3
+    for frame in range(1, settings['frame_count'] + 1):
+        with Image.open(whole_dir / f'Mandala-{frame:02d}.png') as whole, \
+                Image.open(resumed_dir / f'Mandala-{frame:02d}.png') as resumed:
+            assert ImageChops.difference(whole, resumed).getbbox() is None
+
+
+def test_resume_stops_at_a_missing_frame(tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        render(tmp_path, InterruptingCheckpoint(tmp_path, settings, stop_after=3))
+    (tmp_path / 'Mandala-02.png').unlink()
+
+    assert Checkpoint(tmp_path, settings).load(resume=True) == 2
+
+
+def test_unfinished_render_needs_resume(tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        render(tmp_path, InterruptingCheckpoint(tmp_path, settings, stop_after=1))
+
+    with pytest.raises(ValueError, match="--resume"):
+        Checkpoint(tmp_path, settings).load(resume=False)
+
+
+def test_resume_refuses_changed_settings(tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        render(tmp_path, InterruptingCheckpoint(tmp_path, settings, stop_after=1))
+
+    with pytest.raises(ValueError, match="frame_count"):
+        Checkpoint(tmp_path, dict(settings, frame_count=6)).load(resume=True)
+
+
+def test_empty_folder_starts_at_the_first_frame(tmp_path):
+    assert Checkpoint(tmp_path, settings).load(resume=True) == 1
+
+
+def save_numbered_frames(folder_path, frame_count):
+    """Saves tiny frames whose color holds the frame number, written out of order as workers would."""
+
+    for frame in reversed(range(1, frame_count + 1)):
+        Image.new('RGB', (4, 4), (frame % 256, frame // 256, 0)).save(get_frame_path(folder_path, frame))
+
+
+def test_frames_past_99_stay_in_order(tmp_path):
+    save_numbered_frames(tmp_path, 105)
+
+    assert [path.name for path in get_frame_paths(tmp_path)][98:101] == ['Mandala-99.png', 'Mandala-100.png',
+                                                                         'Mandala-101.png']
+    buffer = BytesIO()
+    GifCreator(buffer, tmp_path, encoder='apng', workers=1)
+    with Image.open(BytesIO(buffer.getvalue())) as animation:
+        colors = [frame.convert('RGB').getpixel((0, 0)) for frame in ImageSequence.Iterator(animation)]
+    assert colors == [(frame % 256, frame // 256, 0) for frame in range(1, 106)]
+
+
+def test_resume_past_frame_99(tmp_path):
+    save_numbered_frames(tmp_path, 105)
+    (tmp_path / Checkpoint.file_name).write_text(json.dumps({'settings': settings,
+                                                             'finished_frames': list(range(1, 106))}))
+
+    assert Checkpoint(tmp_path, settings).load(resume=True) == 106
@@ -0,0 +1,69 @@
+from PIL import Image, ImageChops, ImageDraw, ImageFilter
+
+from mandala_gif import Renderer
+from mandala_gif.effects import apply_filter_to_boxes, get_blur_support, get_box_area, get_changed_boxes
+from mandala_gif.equivalence import render_reference
+
+unsharp_mask = ImageFilter.UnsharpMask(radius=4, percent=150, threshold=3)
+support = get_blur_support(4)
+
+
+def make_images(size=(203, 150)):
+    """Returns an image with a few shapes, and a copy with two small changes far apart."""
+
+    previous = Image.new('RGB', size, (20, 40, 60))
+    draw = ImageDraw.Draw(previous)
+    draw.ellipse((30, 20, 170, 130), fill=(200, 120, 40))
+    draw.rectangle((90, 60, 120, 90), fill=(10, 220, 90))
+
+    current = previous.copy()
+    draw = ImageDraw.Draw(current)
+    draw.rectangle((5, 5, 12, 9), fill=(255, 255, 255))
+    draw.point((200, 147), fill=(0, 0, 255))
+    return previous, current
+
+
+def test_identical_images_have_no_changed_boxes():
+    previous, current = make_images()
+
+    assert get_changed_boxes(previous, previous.copy(), 32, support) == []
+
+
+def test_one_changed_pixel_gives_its_tile_grown_by_the_support():
+    previous = Image.new('RGB', (256, 256))
+    current = previous.copy()
+    current.putpixel((100, 70), (1, 0, 0))
+
+    # The pixel is in tile (3, 2); a support of 15 pixels reaches one tile further on every side.
+    assert get_changed_boxes(previous, current, 32, support) == [(64, 32, 160, 128)]
+
+
+def test_boxes_stay_inside_an_image_that_is_not_a_whole_number_of_tiles():
+    previous, current = make_images()
+
+    boxes = get_changed_boxes(previous, current, 32, support)
+    assert len(boxes) == 2
+    for left, top, right, bottom in boxes:
+        assert 0 <= left < right <= 203 and 0 <= top < bottom <= 150
+    assert get_box_area(boxes) < 203 * 150 / 4
+
+
+def test_filtering_the_changed_boxes_matches_filtering_the_whole_image():
+    previous, current = make_images()
+    previous_output = previous.filter(unsharp_mask)
+
+    boxes = get_changed_boxes(previous, current, 32, support)
+    output = apply_filter_to_boxes(current, previous_output, boxes, unsharp_mask, support)
+    assert ImageChops.difference(output, current.filter(unsharp_mask)).getbbox() is None
+
+
+def test_partial_unsharp_mask_matches_the_reference():
+    settings = {'image_side': 400, 'frame_count': 3}
+    renderer = Renderer(settings)
+    renderer.mandala.dirty_area_limit = float('inf')
+
+    images = [renderer.render_frame(frame) for frame in (1, 2, 3)]
+    # Only the first frame has no earlier frame to reuse.
+    assert renderer.mandala.effects_boxes
+    for image, reference in zip(images, render_reference(settings, (1, 2, 3))):
+        assert ImageChops.difference(image, reference).getbbox() is None
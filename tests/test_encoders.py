@@ -0,0 +1,144 @@
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image, ImageChops, ImageSequence
+
+from mandala_gif.encoders import get_encoder
+
+
+def make_frames(count=4, size=(67, 45), mode='RGB'):
+    """Returns frames that differ from each other, with noise so they do not compress to almost nothing."""
+
+    random = np.random.default_rng(0)
+    frames = []
+    for index in range(count):
+        pixels = random.integers(0, 256, (size[1], size[0], len(mode)), dtype=np.uint8)
+        pixels[:, :size[0] // 2] = (index * 60) % 256
+        frames.append(Image.fromarray(pixels, mode))
+    return frames
+
+
+def read_animation(data):
+    """Returns the frames of an animation decoded by Pillow, with the duration of each."""
+
+    with Image.open(BytesIO(data)) as animation:
+        return [(frame.convert(animation.mode), frame.info.get('duration'))
+                for frame in ImageSequence.Iterator(animation)]
+
+
+def assert_same_pixels(expected, actual):
+    assert expected.size == actual.size
+    assert ImageChops.difference(expected.convert('RGBA'), actual.convert('RGBA')).getbbox() is None
+
+
+@pytest.mark.parametrize('size', [(67, 45), (300, 300)])
+def test_apng_round_trip(size):
+    # 300x300 noise compresses to several IDAT chunks, so later frames need several numbered fdAT chunks.
+    frames = make_frames(size=size)
+    data = get_encoder('apng', workers=2).encode(frames)
+
+    decoded = read_animation(data)
+    assert len(decoded) == len(frames)
+    for frame, (decoded_frame, duration) in zip(frames, decoded):
+        assert_same_pixels(frame, decoded_frame)
+        assert duration == 80
+
+
+@pytest.mark.parametrize('name', ['apng', 'webp'])
+def test_frames_of_different_sizes_are_refused(name):
+    with pytest.raises(ValueError, match="same size"):
+        get_encoder(name, workers=1).encode(make_frames(1) + make_frames(1, size=(10, 10)))
+
+
+@pytest.mark.parametrize('mode', ['RGB', 'RGBA'])
+def test_lossless_webp_round_trip(mode):
+    frames = make_frames(mode=mode)
+    data = get_encoder('webp', workers=2, lossless=True).encode(frames)
+
+    decoded = read_animation(data)
+    assert len(decoded) == len(frames)
+    for frame, (decoded_frame, duration) in zip(frames, decoded):
+        assert_same_pixels(frame, decoded_frame)
+        assert duration == 80
+
+
+@pytest.mark.parametrize('mode', ['RGB', 'RGBA'])
+def test_lossy_webp_round_trip(mode):
+    frames = make_frames(size=(33, 17), mode=mode)
+    data = get_encoder('webp', workers=2, quality=100).encode(frames)
+
+    decoded = read_animation(data)
+    assert len(decoded) == len(frames)
+    for frame, (decoded_frame, duration) in zip(frames, decoded):
+        assert decoded_frame.size == frame.size
+        assert duration == 80
+        # The flat half of each frame survives lossy compression almost unchanged.
+        flat_box = (0, 0, frame.size[0] // 2 - 2, frame.size[1])
+        difference = np.asarray(ImageChops.difference(frame.crop(flat_box).convert('RGB'),
+                                                      decoded_frame.crop(flat_box).convert('RGB')))
+        assert difference.max() <= 8
+
+
+def test_gif_round_trip():
+    frames = make_frames()
+    data = get_encoder('gif').encode(frames)
+
+    decoded = read_animation(data)
+    assert len(decoded) == len(frames)
+    assert decoded[0][0].size == frames[0].size
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError, match="Unknown format"):
+        get_encoder('bmp')
+
+
+def test_raw_stream_holds_each_frame_in_turn():
+    frames = make_frames()
+    data = get_encoder('raw').encode(frames)
+
+    frame_size = 67 * 45 * 3
+    assert len(data) == frame_size * len(frames)
+    for index, frame in enumerate(frames):
+        assert data[index * frame_size:(index + 1) * frame_size] == frame.tobytes()
+
+
+def test_y4m_stream_round_trip():
+    frames = make_frames()
+    data = get_encoder('y4m').encode(frames)
+
+    header, data = data.split(b'\n', 1)
+    assert header == b'YUV4MPEG2 W67 H45 F25:2 Ip A1:1 C444 XCOLORRANGE=FULL'
+    plane_size = 67 * 45
+    for frame in frames:
+        assert data.startswith(b'FRAME\n')
+        planes = [Image.frombytes('L', (67, 45), data[6 + plane * plane_size:6 + (plane + 1) * plane_size])
+                  for plane in range(3)]
+        assert Image.merge('YCbCr', planes).tobytes() == frame.convert('YCbCr').tobytes()
+        data = data[6 + 3 * plane_size:]
+    assert data == b''
+
+
+def test_npy_stack_round_trip(tmp_path):
+    frames = make_frames(mode='RGBA')
+    expected = np.stack([np.asarray(frame.convert('RGB')) for frame in frames])
+
+    get_encoder('npy', frame_count=len(frames)).write(str(tmp_path / 'mapped.npy'), frames)
+    assert np.array_equal(np.load(tmp_path / 'mapped.npy'), expected)
+
+    assert np.array_equal(np.load(BytesIO(get_encoder('npy').encode(frames))), expected)
+
+
+def test_stream_writes_each_frame_before_the_next_is_drawn(tmp_path):
+    path = tmp_path / 'frames.rgb'
+    frames = make_frames(2)
+    written_sizes = []
+
+    def draw_frames():
+        for frame in frames:
+            yield frame
+            written_sizes.append(path.stat().st_size)
+
+    get_encoder('raw').write(str(path), draw_frames())
+    assert written_sizes == [67 * 45 * 3, 2 * 67 * 45 * 3]
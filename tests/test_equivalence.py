@@ -0,0 +1,22 @@
+import pytest
+
+from mandala_gif.equivalence import EquivalenceHarness, backends
+
+
+@pytest.fixture(scope='module')
+def harness(tmp_path_factory):
+    # Frames 1 and 2 follow each other, and frame 11 is reached by seeking, after the posterization changes.
+    harness = EquivalenceHarness({'image_side': 600, 'frame_count': 12}, frames=(1, 2, 11),
+                                 golden_dir=tmp_path_factory.mktemp('golden'))
+    harness.load_golden_frames(update=True)
+    return harness
+
+
+@pytest.mark.parametrize('backend_name', [name for name in backends if name != 'reference'])
+def test_backend_draws_exactly_the_reference_frames(harness, backend_name):
+    reference, result = harness.run([backend_name])
+
+    assert reference['max_error'] == 0
+    assert result['backend'] == backend_name
+    assert result['max_error'] == 0
+    assert result['passed']
@@ -0,0 +1,61 @@
+import pytest
+
+from mandala_gif import scheduler
+from mandala_gif.scheduler import MemoryScheduler, format_memory, parse_memory
+
+
+@pytest.mark.parametrize('text, size', [
+    ('512M', 512 * 2 ** 20),
+    ('512MB', 512 * 2 ** 20),
+    ('4G', 4 * 2 ** 30),
+    ('1.5g', 3 * 2 ** 29),
+    (' 64k ', 64 * 2 ** 10),
+    ('1000000', 1000000),
+])
+def test_parse_memory(text, size):
+    assert parse_memory(text) == size
+
+
+@pytest.mark.parametrize('text', ['', 'lots', '4T', 'G'])
+def test_parse_memory_rejects_nonsense(text):
+    with pytest.raises(ValueError):
+        parse_memory(text)
+
+
+def test_format_memory():
+    assert format_memory(300 * 2 ** 20) == "300 MB"
+    assert format_memory(3 * 2 ** 29) == "1.5 GB"
+
+
+def test_too_small_budget_is_refused_before_any_worker_starts():
+    budget = scheduler.get_peak_memory() + 10 * 2 ** 20
+    memory_scheduler = MemoryScheduler(budget, max_workers=4, worker_memory=100 * 2 ** 20)
+
+    with pytest.raises(ValueError, match="too small"):
+        memory_scheduler.get_worker_limit()
+
+
+def test_workers_fit_in_the_budget_after_calibration():
+    budget = scheduler.get_peak_memory() + 350 * 2 ** 20
+    memory_scheduler = MemoryScheduler(budget, max_workers=8, worker_memory=100 * 2 ** 20)
+
+    assert memory_scheduler.get_worker_limit() == 1
+    memory_scheduler.task_count = MemoryScheduler.calibration_tasks
+    # 100 MB with 10% headroom fits three times in 350 MB.
+    assert memory_scheduler.get_worker_limit() == 3
+
+
+def test_budget_without_a_way_to_measure_memory_is_refused(monkeypatch):
+    monkeypatch.setattr(scheduler, 'get_peak_memory', lambda: None)
+
+    with pytest.raises(ValueError, match="resource module"):
+        MemoryScheduler(2 ** 30)
+    assert MemoryScheduler().get_worker_limit() >= 1
+
+
+def test_map_yields_results_in_order():
+    memory_scheduler = MemoryScheduler(max_workers=2)
+
+    assert list(memory_scheduler.map(pow, [(number, 2) for number in range(6)])) == [0, 1, 4, 9, 16, 25]
+    assert memory_scheduler.task_count == 6
+    assert memory_scheduler.format_report().startswith("Rendered 6 frames")
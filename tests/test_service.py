@@ -0,0 +1,88 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from mandala_gif import RenderService
+
+
+@pytest.fixture(scope='module')
+def service_url():
+    service = RenderService(port=0)
+    thread = threading.Thread(target=service.server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{service.server.server_port}'
+    service.server.shutdown()
+    service.server.server_close()
+
+
+def post(url, body):
+    """Posts a body to the service, returning the status code, content type and response body."""
+
+    try:
+        with urllib.request.urlopen(url, body) as response:
+            return response.status, response.headers['Content-Type'], response.read()
+    except urllib.error.HTTPError as error:
+        return error.code, error.headers['Content-Type'], error.read()
+
+
+def test_renders_a_frame_as_png(service_url):
+    job = {'frame': 2, 'settings': {'image_side': 400, 'frame_count': 4}}
+    status, content_type, body = post(f'{service_url}/render', json.dumps(job).encode())
+
+    assert status == 200
+    assert content_type == 'image/png'
+    assert body.startswith(b'\x89PNG')
+
+
+@pytest.mark.parametrize('body', [
+    b'not json',
+    b'[1, 2]',
+    b'{"frame": 3, "settings": 5}',
+    b'{"frame": 3, "settings": {"frame_count": "x"}}',
+    b'{"frame": 3, "settings": {"no_such_setting": 1}}',
+    b'{"frame": 1, "settings": {"frame_count": 2.5}}',
+    b'{"frame": 1, "settings": {"frame_count": 0}}',
+    b'{"frame": 1, "settings": {"circle_hue_count": 2.5}}',
+    b'{"frame": 1, "settings": {"circle_hue_count": 0}}',
+    b'{"frame": 1, "settings": {"grey_hue_count": 12}}',
+    b'{"frame": 1, "settings": {"background_pattern_count": 0}}',
+    b'{"frame": 1, "settings": {"border_circle_divisor": 2}}',
+    b'{"frame": 1, "settings": {"posterize_bits": 0}}',
+    b'{"frame": 1, "settings": {"posterize_bits": 9}}',
+    b'{"frame": 1, "settings": {"image_side": 100}}',
+    b'{"frame": 1, "settings": {"image_side": 400.5}}',
+    b'{"frame": 1, "settings": {"image_side": 400, "border_circle_divisor": 4}}',
+    b'{"frame": 3, "preset": [1]}',
+    b'{"frame": 3, "preset": "no_such_preset"}',
+    b'{"frame": "3"}',
+    b'{"frame": 99}',
+    b'{"frame": 1, "region": [0, 0, 10]}',
+    b'{"frame": 1, "region": [0, 0, 5000, 5000]}',
+    b'{"region": [0, 0, 10, 10]}',
+    b'{"frame": 1, "format": "webp"}',
+    b'{"format": "no_such_format", "settings": {"frame_count": 1}}',
+    b'{"colour": "red"}',
+])
+def test_rejects_bad_jobs_with_400(service_url, body):
+    status, content_type, response = post(f'{service_url}/render', body)
+
+    assert status == 400
+
+
+def test_unknown_path_is_404(service_url):
+    status, content_type, body = post(f'{service_url}/other', b'{}')
+
+    assert status == 404
+
+
+def test_unexpected_error_is_500(service_url, monkeypatch):
+    def fail(self, job):
+        raise RuntimeError("a bug")
+
+    monkeypatch.setattr(RenderService, 'render_job', fail)
+    status, content_type, body = post(f'{service_url}/render', b'{"frame": 1}')
+
+    assert status == 500